@@ -21,6 +21,7 @@ from models.lot_models import (
     StorageContract,
     StorageData,
     Vehicle,
+    parse_date,
 )
 from utils.persistence import load_data, save_data, load_fee_templates, save_fee_templates
 from utils.config import ENABLE_INVOLUNTARY_TOWS, MAX_ADMIN_FEE, MAX_LIEN_FEE
@@ -252,14 +253,23 @@ def build_contract(
     return contract
 
 
+def add_contracts(storage_data: StorageData, contracts: List[StorageContract]) -> None:
+    """Append new contracts in one batch, assigning sequential contract IDs.
+    
+    Single intakes pass a one-item list, so interactive and bulk imports share
+    the same path. Callers save once afterwards.
+    """
+    next_id = storage_data.next_id
+    for offset, contract in enumerate(contracts):
+        contract.contract_id = next_id + offset
+    storage_data.contracts.extend(contracts)
+    storage_data.next_id = next_id + len(contracts)
+
+
 # ---------------------------------------------------------------------------
 # Calculation helpers
 # ---------------------------------------------------------------------------
 
-def parse_date(date_str: str) -> datetime:
-    return datetime.strptime(date_str, DATE_FORMAT)
-
-
 def is_recovery_type(contract: StorageContract) -> bool:
     """Check if contract is recovery/tow & recovery type (subject to FL 713.78 rules).
     
@@ -492,6 +502,19 @@ def balance(contract: StorageContract, as_of: datetime | None = None, include_br
     return balance_amount
 
 
+def contract_balances(contracts: List[StorageContract], as_of: datetime | None = None) -> Dict[int, float]:
+    """
+    Calculate balances for many contracts in one pass.
+    
+    The as-of date is resolved once for the whole batch instead of per contract.
+    
+    Returns:
+        Dict mapping contract_id to its balance
+    """
+    as_of = as_of or datetime.today()
+    return {c.contract_id: balance(c, as_of) for c in contracts}
+
+
 def past_due_status(contract: StorageContract, as_of: datetime | None = None) -> Tuple[bool, int]:
     """Check if contract is past due. Delegates to specialized modules."""
     contract_type = contract.contract_type.lower()
@@ -758,13 +781,10 @@ def format_payments_block(contract_or_payments) -> list[str]:
     if payments is None:
         payments = contract_or_payments or []
 
-    lines: list[str] = []
-    lines.append("")
-    lines.append("Payments Recorded:")
+    lines: list[str] = ["", "Payments Recorded:"]
     # Header
     if payments:
-        lines.append(f"{'Date':<12} {'Amount':<10} {'Method':<15} {'Note':<30}")
-        lines.append("-" * 67)
+        lines += (f"{'Date':<12} {'Amount':<10} {'Method':<15} {'Note':<30}", "-" * 67)
         for p in payments:
             if isinstance(p, dict):
                 date = p.get("date", "")
@@ -786,14 +806,37 @@ def format_payments_block(contract_or_payments) -> list[str]:
     return lines
 
 
+def format_notice_lines(contract: StorageContract):
+    """Yield the "Notices Sent" lines shared by the summary and record formats."""
+    if not contract.notices:
+        yield "- None recorded"
+        return
+    for n in contract.notices:
+        date_shown = n.date_sent if n.date_sent else n.date_generated
+        yield f"- {n.notice_type} sent {date_shown} | Due ${n.amount_due:.2f} | {n.notes}"
 
 
-def format_contract_summary(contract: StorageContract, as_of: datetime | None = None) -> str:
+def format_contract_summary(
+    contract: StorageContract,
+    as_of: datetime | None = None,
+    *,
+    lien_dates: Dict[str, any] | None = None,
+    lien_status: str | None = None,
+) -> str:
+    """
+    Format the contract summary shown in the contracts tab.
+    
+    Callers that already hold the contract's lien_timeline() result or
+    lien_eligibility() status text can pass them in to skip recomputing them.
+    """
     as_of = as_of or datetime.today()
     charges = calculate_charges(contract, as_of)
-    bal = balance(contract, as_of)
-    lien_dates = lien_timeline(contract)
-    is_lien_eligible, lien_status = lien_eligibility(contract, as_of)
+    paid = total_payments(contract)
+    bal = round(charges["subtotal"] - paid, 2)
+    if lien_dates is None:
+        lien_dates = lien_timeline(contract)
+    if lien_status is None:
+        lien_status = lien_eligibility(contract, as_of)[1]
     lines = [
         "Storage & Recovery Contract Summary",
         "-----------------------------------",
@@ -809,7 +852,7 @@ def format_contract_summary(contract: StorageContract, as_of: datetime | None =
         f"Storage Accrued ({storage_days(contract, as_of)} days): ${charges['storage']:.2f}",
         f"Tow Fees: ${charges.get('tow_fees', 0):.2f}",
         f"Recovery Fees: ${charges.get('recovery', 0):.2f}",
-        f"Payments: ${total_payments(contract):.2f}",
+        f"Payments: ${paid:.2f}",
         f"Balance as of {as_of.strftime(DATE_FORMAT)}: ${bal:.2f}",
         "",
         "Lien Timeline:",
@@ -821,22 +864,15 @@ def format_contract_summary(contract: StorageContract, as_of: datetime | None =
         "",
         "Notices Sent:",
     ]
-    if contract.notices:
-        for n in contract.notices:
-            date_shown = n.date_sent if n.date_sent else n.date_generated
-            lines.append(f"- {n.notice_type} sent {date_shown} | Due ${n.amount_due:.2f} | {n.notes}")
-    else:
-        lines.append("- None recorded")
+    lines.extend(format_notice_lines(contract))
 
     if contract.notes:
         lines.append("\nNotes:")
-        for note in contract.notes:
-            lines.append(f"- {note}")
+        lines.extend(f"- {note}" for note in contract.notes)
 
     if contract.attachments:
         lines.append("\nAttachments (paths only):")
-        for path in contract.attachments:
-            lines.append(f"- {path}")
+        lines.extend(f"- {path}" for path in contract.attachments)
 
     # Append payments block
     lines.extend(format_payments_block(contract))
@@ -851,7 +887,8 @@ def format_contract_record(contract: StorageContract, as_of: datetime | None = N
     """
     as_of = as_of or datetime.today()
     charges = calculate_charges(contract, as_of)
-    bal = balance(contract, as_of)
+    paid = total_payments(contract)
+    bal = round(charges["subtotal"] - paid, 2)
     lien_dates = lien_timeline(contract)
     is_lien_eligible, lien_status = lien_eligibility(contract, as_of)
     
@@ -861,15 +898,11 @@ def format_contract_record(contract: StorageContract, as_of: datetime | None = N
     end_dt = as_of
     date_range = f"{start_dt.strftime('%b %d')} – {end_dt.strftime('%b %d')}"
     
-    if contract.rate_mode == "weekly":
-        storage_rate_display = f"Weekly Rate: ${contract.weekly_storage_fee:.2f}"
-        storage_detail = f"Storage: ${charges['storage']:.2f} (Weekly rate, {date_range}, {days} days)"
-    elif contract.rate_mode == "monthly":
-        storage_rate_display = f"Monthly Rate: ${contract.monthly_storage_fee:.2f}"
-        storage_detail = f"Storage: ${charges['storage']:.2f} (Monthly rate, {date_range}, {days} days)"
-    else:
-        storage_rate_display = f"Daily Rate: ${contract.daily_storage_fee:.2f}"
-        storage_detail = f"Storage: ${charges['storage']:.2f} (Daily rate, {date_range}, {days} days)"
+    # Unknown rate modes are billed (and shown) at the daily rate
+    rate_mode = contract.rate_mode if contract.rate_mode in storage_logic.RATE_PERIODS else "daily"
+    rate_fee = getattr(contract, storage_logic.RATE_PERIODS[rate_mode][1])
+    storage_rate_display = f"{rate_mode.title()} Rate: ${rate_fee:.2f}"
+    storage_detail = f"Storage: ${charges['storage']:.2f} ({rate_mode.title()} rate, {date_range}, {days} days)"
     
     lines = [
         "Storage & Recovery Contract Record",
@@ -890,7 +923,7 @@ def format_contract_record(contract: StorageContract, as_of: datetime | None = N
         f"  Recovery Fees: ${charges.get('recovery_fees', 0.0):.2f}",
         f"  Admin: ${charges['admin']:.2f}",
         f"  Total Charges: ${charges['subtotal']:.2f}",
-        f"  Total Payments: ${total_payments(contract):.2f}",
+        f"  Total Payments: ${paid:.2f}",
         f"  BALANCE as of {as_of.strftime(DATE_FORMAT)}: ${bal:.2f}",
         "",
         "Lien Timeline:",
@@ -902,26 +935,17 @@ def format_contract_record(contract: StorageContract, as_of: datetime | None = N
         "",
         "Notices Sent:",
     ]
-    if contract.notices:
-        for n in contract.notices:
-            date_shown = n.date_sent if n.date_sent else n.date_generated
-            lines.append(f"- {n.notice_type} sent {date_shown} | Due ${n.amount_due:.2f} | {n.notes}")
-    else:
-        lines.append("- None recorded")
+    lines.extend(format_notice_lines(contract))
 
     # Payments (use shared helper)
     lines.extend(format_payments_block(contract))
 
     if contract.notes:
-        lines.append("")
-        lines.append("Notes:")
-        for note in contract.notes:
-            lines.append(f"- {note}")
+        lines += ("", "Notes:")
+        lines.extend(f"- {note}" for note in contract.notes)
 
     if contract.attachments:
-        lines.append("")
-        lines.append("Attachments (paths only):")
-        for path in contract.attachments:
-            lines.append(f"- {path}")
+        lines += ("", "Attachments (paths only):")
+        lines.extend(f"- {path}" for path in contract.attachments)
 
     return "\n".join(lines)
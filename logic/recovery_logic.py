@@ -15,7 +15,7 @@ import math
 from datetime import datetime, timedelta
 from typing import Tuple
 
-from models.lot_models import StorageContract, DATE_FORMAT
+from models.lot_models import StorageContract, DATE_FORMAT, parse_date
 from utils.config import ENABLE_INVOLUNTARY_TOWS, MAX_ADMIN_FEE, MAX_LIEN_FEE
 
 # Florida Statute 713.78 timeline
@@ -106,7 +106,7 @@ def recovery_lien_timeline(contract: StorageContract) -> dict:
     Returns:
         Dictionary with timeline dates and eligibility flags
     """
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     
     # Determine vehicle age
     current_year = datetime.now().year
@@ -151,7 +151,7 @@ def recovery_past_due_status(contract: StorageContract) -> Tuple[bool, int]:
     Returns:
         Tuple of (is_past_due, days_since_recovery)
     """
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     days = (datetime.now() - start).days
     
     # Consider past due if no payment and lien notice deadline passed
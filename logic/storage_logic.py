@@ -7,11 +7,10 @@ Storage contracts are for customers who voluntarily store vehicles.
 """
 from __future__ import annotations
 
-import math
 from datetime import datetime, timedelta
 from typing import Tuple
 
-from models.lot_models import StorageContract, DATE_FORMAT
+from models.lot_models import StorageContract, DATE_FORMAT, parse_date
 
 # Storage-only lien schedule (slower than recovery)
 STORAGE_SCHEDULE = {
@@ -21,6 +20,24 @@ STORAGE_SCHEDULE = {
     "sale_eligible_days": 120,    # Sale eligibility
 }
 
+# Billing period length in days and the contract fee charged per period, by rate mode
+RATE_PERIODS = {
+    "daily": (1, "daily_storage_fee"),
+    "weekly": (7, "weekly_storage_fee"),
+    "monthly": (30, "monthly_storage_fee"),
+}
+
+
+def storage_charge_for_days(contract: StorageContract, days: int) -> float:
+    """Charge for a stay of ``days`` at the contract's rate mode.
+    
+    Stays are billed in whole periods, rounded up. Unknown rate modes
+    fall back to the daily rate.
+    """
+    period_days, fee_field = RATE_PERIODS.get(contract.rate_mode, RATE_PERIODS["daily"])
+    periods = -(-days // period_days)
+    return periods * getattr(contract, fee_field)
+
 
 def calculate_storage_fees(contract: StorageContract, as_of_date: datetime = None) -> float:
     """Calculate storage fees for storage-only contract.
@@ -38,26 +55,13 @@ def calculate_storage_fees(contract: StorageContract, as_of_date: datetime = Non
     if as_of_date is None:
         as_of_date = datetime.now()
     
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     days = (as_of_date - start).days
     
     if days < 0:
         return 0.0
     
-    if contract.rate_mode == "daily":
-        return days * contract.daily_storage_fee
-    
-    elif contract.rate_mode == "weekly":
-        weeks = math.ceil(days / 7)
-        return weeks * contract.weekly_storage_fee
-    
-    elif contract.rate_mode == "monthly":
-        months = math.ceil(days / 30)
-        return months * contract.monthly_storage_fee
-    
-    else:
-        # Fallback to daily if unknown mode
-        return days * contract.daily_storage_fee
+    return storage_charge_for_days(contract, days)
 
 
 def storage_lien_timeline(contract: StorageContract) -> dict:
@@ -72,7 +76,7 @@ def storage_lien_timeline(contract: StorageContract) -> dict:
     Returns:
         Dictionary with timeline dates and eligibility flags
     """
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     
     first_notice_date = start + timedelta(days=STORAGE_SCHEDULE["first_notice_days"])
     second_notice_date = start + timedelta(days=STORAGE_SCHEDULE["second_notice_days"])
@@ -115,7 +119,7 @@ def storage_past_due_status(contract: StorageContract) -> Tuple[bool, int]:
         return False, 0
     
     # Calculate days since start
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     days = (datetime.now() - start).days
     
     # Consider past due if unpaid and more than 30 days
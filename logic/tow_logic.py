@@ -9,11 +9,11 @@ Tow contracts are for voluntary towing services.
 """
 from __future__ import annotations
 
-import math
 from datetime import datetime, timedelta
 from typing import Tuple
 
-from models.lot_models import StorageContract, DATE_FORMAT
+from models.lot_models import StorageContract, parse_date
+from .storage_logic import storage_charge_for_days
 from utils.config import TOW_STORAGE_EXEMPTION_HOURS
 
 # Tow contracts don't have lien process (voluntary service)
@@ -49,7 +49,7 @@ def calculate_tow_fees(contract: StorageContract) -> float:
     
     # Labor charges (billed in 15-minute blocks)
     if contract.extra_labor_minutes > 0:
-        blocks = math.ceil(contract.extra_labor_minutes / LABOR_BLOCK_MINUTES)
+        blocks = -(-contract.extra_labor_minutes // LABOR_BLOCK_MINUTES)  # ceil without float division
         hourly_rate = contract.labor_rate_per_hour
         block_rate = (hourly_rate / 60) * LABOR_BLOCK_MINUTES
         total += blocks * block_rate
@@ -78,7 +78,7 @@ def calculate_tow_storage_fees(contract: StorageContract, as_of_date: datetime =
     if as_of_date is None:
         as_of_date = datetime.now()
     
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     
     # Calculate time on lot
     time_on_lot = as_of_date - start
@@ -94,20 +94,7 @@ def calculate_tow_storage_fees(contract: StorageContract, as_of_date: datetime =
     if days < 0:
         return 0.0
     
-    if contract.rate_mode == "daily":
-        return days * contract.daily_storage_fee
-    
-    elif contract.rate_mode == "weekly":
-        weeks = math.ceil(days / 7)
-        return weeks * contract.weekly_storage_fee
-    
-    elif contract.rate_mode == "monthly":
-        months = math.ceil(days / 30)
-        return months * contract.monthly_storage_fee
-    
-    else:
-        # Fallback to daily if unknown mode
-        return days * contract.daily_storage_fee
+    return storage_charge_for_days(contract, days)
 
 
 def tow_past_due_status(contract: StorageContract) -> Tuple[bool, int]:
@@ -121,7 +108,7 @@ def tow_past_due_status(contract: StorageContract) -> Tuple[bool, int]:
     Returns:
         Tuple of (is_past_due, days_overdue)
     """
-    start = datetime.strptime(contract.start_date, DATE_FORMAT)
+    start = parse_date(contract.start_date)
     payment_due = start + timedelta(days=TOW_PAYMENT_EXPECTATION_DAYS)
     today = datetime.now()
     
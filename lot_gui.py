@@ -1,11 +1,16 @@
 """PyQt6 UI for the Storage & Recovery Lot program."""
 from __future__ import annotations
 
+import os
 import sys
+import subprocess
 import traceback
 import csv
+import html
+import re
 import shutil
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional
 from collections import defaultdict
@@ -18,18 +23,18 @@ from PyQt6.QtWidgets import (
     QHeaderView, QFrame, QScrollArea, QRadioButton, QButtonGroup,
     QListWidget, QListWidgetItem
 )
-from PyQt6.QtCore import Qt, QSize, QPoint, QRect, pyqtSignal, QEvent
+from PyQt6.QtCore import Qt, QSize, QPoint, QRect, QTimer, pyqtSignal, QEvent
 from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QAction
 
 from logic.lot_logic import (
-    add_notice, balance, default_fee_schedule,
+    FEE_TEMPLATES, add_audit_entry, add_contracts, add_notice, balance, contract_balances, default_fee_schedule,
     format_contract_summary, format_contract_record, lien_eligibility,
     lien_timeline, past_due_status,
     record_payment, storage_days,
 )
-from models.lot_models import Customer, Vehicle, StorageContract, StorageData, DATE_FORMAT, Payment
+from models.lot_models import Customer, Vehicle, StorageContract, StorageData, DATE_FORMAT, Payment, parse_date
 from utils.persistence import (
-    load_data, save_data, load_fee_templates, save_fee_templates,
+    load_data, save_data, save_fee_templates,
     backup_data as create_backup, DATA_PATH
 )
 from utils.config import ENABLE_INVOLUNTARY_TOWS, MAX_ADMIN_FEE, MAX_LIEN_FEE, TOW_STORAGE_EXEMPTION_HOURS
@@ -49,6 +54,116 @@ from ui.settings_dialog import SettingsDialog
 from ui.settings_dialog import SettingsDialog
 
 
+# Row highlight colors for the contract table, built once and shared by every row
+# (background, status text)
+ROW_HIGHLIGHT_COLORS = {
+    "sale": (QColor("#e3f2fd"), QColor("#1565c0")),  # Light blue / dark blue
+    "lien": (QColor("#fff3e0"), QColor("#e65100")),  # Light orange / dark orange
+    "past_due": (QColor("#ffebee"), QColor("#c62828")),  # Light red / dark red
+}
+URGENT_MILESTONE_COLOR = QColor("#c62828")
+
+# Shape of a complete YYYY-MM-DD entry in the date range filter boxes; partial
+# input while typing is rejected here without paying for a failed parse
+DATE_INPUT_RE = re.compile(r"\d{4}-\d{1,2}-\d{1,2}")
+
+# Write buffer for the CSV export, which issues one small write per row
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _set_style_if_changed(widget: QWidget, style: str) -> None:
+    """Apply a stylesheet only when it differs from the widget's current one.
+    
+    Every setStyleSheet call makes Qt re-parse the sheet and re-polish the
+    widget, which the intake form's per-keystroke validators would otherwise pay on
+    each character even when the border color stays the same.
+    """
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+def _open_path(path: str) -> None:
+    """Open a file with the platform's default application without blocking.
+    
+    Windows hands the file straight to the shell via os.startfile; elsewhere the
+    opener is launched with Popen so the UI does not wait for it to exit.
+    """
+    if sys.platform.startswith("win"):
+        os.startfile(path)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["open", path])
+    else:
+        subprocess.Popen(["xdg-open", path])
+
+
+def _contract_csv_rows(contracts, today: datetime) -> list:
+    """Build the CSV export's data rows as plain tuples.
+    
+    Runs on the UI thread so the export worker never reads the live
+    contracts while a payment or edit may be changing them.
+    """
+    rows = []
+    for contract in contracts:
+        is_lien_eligible, _ = lien_eligibility(contract, today)
+        is_sale_eligible = lien_timeline(contract).get("is_sale_eligible", False)
+        rows.append((
+            contract.contract_id,
+            contract.customer.name,
+            contract.customer.phone,
+            contract.vehicle.vehicle_type,
+            contract.vehicle.make,
+            contract.vehicle.model,
+            contract.vehicle.year or '',
+            contract.vehicle.plate,
+            contract.vehicle.vin or '',
+            contract.contract_type,
+            contract.start_date,
+            contract.rate_mode,
+            contract.daily_storage_fee,
+            contract.weekly_storage_fee,
+            contract.monthly_storage_fee,
+            # Formatted per row in plain Python: the balance is the only value
+            # formatted here, and NumPy (not a dependency) would cost more to
+            # import than np.char.mod could save
+            "%.2f" % balance(contract, today),
+            contract.status,
+            (today - parse_date(contract.start_date)).days,
+            'Yes' if is_lien_eligible else 'No',
+            'Yes' if is_sale_eligible else 'No'
+        ))
+    return rows
+
+
+def _write_contracts_csv(filename: str, rows: list, business_name: str, report_footer: str) -> None:
+    """Write the contracts CSV export (runs on the export worker thread)."""
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        
+        # Business header if available
+        if business_name:
+            writer.writerow([business_name])
+            writer.writerow([f"Export Date: {datetime.today().strftime('%B %d, %Y')}"])
+            writer.writerow([])  # Blank row
+        
+        # Column headers
+        writer.writerow(['ID', 'Customer Name', 'Phone', 'Vehicle Type', 'Make', 'Model', 
+                       'Year', 'Plate', 'VIN', 'Contract Type', 'Start Date', 'Rate Mode',
+                       'Daily Fee', 'Weekly Fee', 'Monthly Fee', 'Balance', 'Status', 
+                       'Days in Storage', 'Lien Eligible', 'Sale Eligible'])
+        
+        writer.writerows(rows)
+        
+        # Add legal disclaimers
+        writer.writerow([])  # Blank row
+        writer.writerow(["NOTICE: This document is for informational purposes only and is not a lien notice."])
+        writer.writerow(["All amounts shown are subject to Florida law and may be adjusted. This is not a final bill."])
+        
+        # Add footer if configured
+        if report_footer:
+            writer.writerow([])  # Blank row
+            writer.writerow([report_footer])
+
+
 class CustomTitleBar(QWidget):
     """Custom title bar with menu bar and window controls."""
     
@@ -119,7 +234,7 @@ class CustomTitleBar(QWidget):
         # App title (centered) - this will be the drag handle
         self.title_label = QLabel("Storage & Recovery Lot")
         self.title_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-        self.title_label.setStyleSheet(f"color: {self.theme_colors['titlebar_fg']}; padding: 10px;")
+        self.title_label.setStyleSheet(f"color: {self.theme_colors.titlebar_fg}; padding: 10px;")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_label)
         
@@ -127,7 +242,7 @@ class CustomTitleBar(QWidget):
         
         # Search bar (before window controls)
         search_icon = QLabel("🔍")
-        search_icon.setStyleSheet(f"color: {self.theme_colors['titlebar_fg']}; padding: 0 5px;")
+        search_icon.setStyleSheet(f"color: {self.theme_colors.titlebar_fg}; padding: 0 5px;")
         layout.addWidget(search_icon)
         
         self.search_box = QLineEdit()
@@ -143,19 +258,19 @@ class CustomTitleBar(QWidget):
         btn_style = get_title_bar_control_button_style(self.theme_colors)
         
         self.min_btn = QPushButton("—")
-        self.min_btn.setStyleSheet(btn_style % (self.theme_colors['titlebar_fg'], self.theme_colors['button_hover']))
+        self.min_btn.setStyleSheet(btn_style % (self.theme_colors.titlebar_fg, self.theme_colors.button_hover))
         self.min_btn.clicked.connect(self.minimize_clicked.emit)
         self.min_btn.setFixedSize(45, 40)
         layout.addWidget(self.min_btn)
         
         self.max_btn = QPushButton("□")
-        self.max_btn.setStyleSheet(btn_style % (self.theme_colors['titlebar_fg'], self.theme_colors['button_hover']))
+        self.max_btn.setStyleSheet(btn_style % (self.theme_colors.titlebar_fg, self.theme_colors.button_hover))
         self.max_btn.clicked.connect(self.maximize_clicked.emit)
         self.max_btn.setFixedSize(45, 40)
         layout.addWidget(self.max_btn)
         
         self.close_btn = QPushButton("✕")
-        self.close_btn.setStyleSheet(btn_style % (self.theme_colors['titlebar_fg'], "#e81123"))
+        self.close_btn.setStyleSheet(btn_style % (self.theme_colors.titlebar_fg, "#e81123"))
         self.close_btn.clicked.connect(self.close_clicked.emit)
         self.close_btn.setFixedSize(45, 40)
         layout.addWidget(self.close_btn)
@@ -300,25 +415,22 @@ class ContractEditDialog(QDialog):
         except ValueError:
             pass
         
-        # Update admin fee
-        try:
-            self.contract.admin_fee = float(self.admin_fee.text() or 0)
-        except ValueError:
-            pass
-        
-        # Update tow fields if applicable
-        if self.contract.contract_type.lower() == "tow":
-            try:
-                self.contract.tow_base_fee = float(self.tow_base_fee.text() or 0)
-                self.contract.tow_miles_used = float(self.tow_miles_used.text() or 0)
-                self.contract.tow_labor_hours = float(self.tow_labor_hours.text() or 0)
-            except ValueError:
-                pass
-        
-        # Update recovery fields if applicable
-        if self.contract.contract_type.lower() == "recovery":
+        # Numeric fields shown for this contract type: (attribute, input, type)
+        numeric_fields = [("admin_fee", self.admin_fee, float)]
+        contract_type = self.contract.contract_type.lower()
+        if contract_type == "tow":
+            numeric_fields += [
+                ("tow_base_fee", self.tow_base_fee, float),
+                ("tow_miles_used", self.tow_miles_used, float),
+                ("tow_labor_hours", self.tow_labor_hours, float),
+            ]
+        elif contract_type == "recovery":
+            numeric_fields.append(("notices_sent", self.notices_sent, int))
+        
+        # Blank means zero; a value that doesn't parse keeps the stored one
+        for name, field_input, convert in numeric_fields:
             try:
-                self.contract.notices_sent = int(self.notices_sent.text() or 0)
+                setattr(self.contract, name, convert(field_input.text() or 0))
             except ValueError:
                 pass
         
@@ -331,10 +443,13 @@ class ContractEditDialog(QDialog):
 class LotAppQt(QMainWindow):
     """Main application window."""
     
+    export_finished = pyqtSignal(str, int, bool, str)  # filename, contract count, ok, error
+    
     def __init__(self):
         super().__init__()
         self.storage_data: StorageData = load_data()
-        self.fee_templates: Dict[str, Dict[str, float]] = load_fee_templates()
+        # Share the templates lot_logic loaded at import instead of parsing the file again
+        self.fee_templates: Dict[str, Dict[str, float]] = FEE_TEMPLATES
         
         # Initialize settings manager
         from utils.settings_manager import SettingsManager
@@ -357,6 +472,12 @@ class LotAppQt(QMainWindow):
         self.current_cursor_edge = None  # Track which edge cursor is showing
         self.menu_is_open = False  # Track if any menu is currently open
         self.active_menu = None  # Track which menu is currently displayed
+        self._urgent_milestone_font: Optional[QFont] = None  # Built on first use
+        self.search_index: Dict[int, str] = {}  # contract_id -> search key, built by apply_filters
+        self._summary_cache = None  # (summary_cache_key, summary text) on screen, see on_contract_selected
+        self._fee_dialog: Optional[SettingsDialog] = None  # Built on first use, see show_fee_settings
+        self._export_executor = ThreadPoolExecutor(max_workers=1)
+        self.export_finished.connect(self.on_export_finished)
         
         # Try to load custom cursors from system theme
         self.custom_cursors = None
@@ -388,10 +509,6 @@ class LotAppQt(QMainWindow):
     def auto_backup_on_startup(self):
         """Create automatic backup on application startup."""
         try:
-            import os
-            import shutil
-            from pathlib import Path
-            from datetime import timedelta
             
             # Get backup settings
             if not self.settings_manager.get('auto_backup_enabled', True):
@@ -578,6 +695,10 @@ class LotAppQt(QMainWindow):
         self.create_contracts_tab()
         self.create_intake_tab()
         self.create_reports_tab()
+        
+        # Dashboard rebuilds requested while it is hidden wait until it is shown
+        self.dashboard_stale = False
+        self.tabs.currentChanged.connect(self.on_tab_changed)
     
     def create_dashboard_tab(self):
         """Create the dashboard overview tab using modular dashboard component."""
@@ -595,71 +716,56 @@ class LotAppQt(QMainWindow):
             self.tabs.setTabText(0, "Dashboard")
             self.tabs.tabBar().setTabTextColor(0, QColor("#000000"))
     
+    @staticmethod
+    def urgent_deadlines(contract: StorageContract, today: datetime):
+        """Yield (key, date_str, days_until) for each timeline deadline due today or overdue."""
+        for key, date_str in lien_timeline(contract).items():
+            if date_str and (key.endswith('_date') or key.endswith('_due')):
+                try:
+                    days_until = (parse_date(date_str) - today).days
+                except (ValueError, TypeError):
+                    continue
+                if days_until <= 0:
+                    yield key, date_str, days_until
+    
     def count_urgent_items(self):
         """Count contracts with urgent deadlines (today or overdue)."""
-        urgent_count = 0
         today = datetime.today()
+        balances = contract_balances(self.storage_data.contracts, today)
         
-        for contract in self.storage_data.contracts:
-            # Skip paid contracts
-            if balance(contract) == 0:
-                continue
-            
-            timeline = lien_timeline(contract)
-            
-            # Check all deadline dates
-            for key, date_str in timeline.items():
-                if date_str and (key.endswith('_date') or key.endswith('_due')):
-                    try:
-                        deadline_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        days_until = (deadline_date - today).days
-                        
-                        # Count if today or overdue
-                        if days_until <= 0:
-                            urgent_count += 1
-                            break  # Only count each contract once
-                    except (ValueError, KeyError, AttributeError):
-                        pass
-        
-        return urgent_count
+        # Skip paid contracts; any() stops at the first urgent deadline per contract
+        return sum(
+            1 for contract in self.storage_data.contracts
+            if balances[contract.contract_id] != 0 and any(self.urgent_deadlines(contract, today))
+        )
     
     def check_urgent_alerts(self):
         """Check for urgent items and show alert dialog on startup."""
         urgent_items = []
         today = datetime.today()
+        balances = contract_balances(self.storage_data.contracts, today)
         
         for contract in self.storage_data.contracts:
             # Skip paid contracts
-            if balance(contract) == 0:
+            bal = balances[contract.contract_id]
+            if bal == 0:
                 continue
             
-            timeline = lien_timeline(contract)
-            contract_alerts = []
-            
-            # Check all deadline dates
-            for key, date_str in timeline.items():
-                if date_str and (key.endswith('_date') or key.endswith('_due')):
-                    try:
-                        deadline_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        days_until = (deadline_date - today).days
-                        
-                        # Alert if today or overdue
-                        if days_until <= 0:
-                            status = "TODAY!" if days_until == 0 else f"{abs(days_until)} days OVERDUE"
-                            contract_alerts.append({
-                                'deadline': key.replace('_', ' ').title(),
-                                'date': date_str,
-                                'status': status
-                            })
-                    except (ValueError, KeyError, AttributeError):
-                        pass
+            contract_alerts = [
+                {
+                    'deadline': key.replace('_', ' ').title(),
+                    'date': date_str,
+                    'status': "TODAY!" if days_until == 0 else f"{abs(days_until)} days OVERDUE"
+                }
+                for key, date_str, days_until in self.urgent_deadlines(contract, today)
+            ]
             
             if contract_alerts:
                 urgent_items.append({
                     'contract_id': contract.contract_id,
                     'customer': contract.customer.name,
                     'vehicle': f"{contract.vehicle.vehicle_type} {contract.vehicle.plate}",
-                    'balance': balance(contract),
+                    'balance': bal,
                     'alerts': contract_alerts
                 })
         
@@ -687,37 +793,28 @@ class LotAppQt(QMainWindow):
         header.setStyleSheet(f"color: {danger_color}; padding: 10px; background-color: {danger_bg}; border-radius: 5px;")
         layout.addWidget(header)
         
-        # Scrollable list of urgent items
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        
+        # All urgent items rendered into one scrollable rich-text view instead of
+        # a framed widget plus two or more labels per contract
+        blocks = []
         for item in urgent_items:
-            item_frame = QFrame()
-            item_frame.setFrameStyle(QFrame.Shape.Box)
-            item_frame.setStyleSheet(f"border: 2px solid {danger_color}; border-radius: 5px; padding: 10px; margin: 5px;")
-            item_layout = QVBoxLayout(item_frame)
-            
-            # Contract info
-            info_label = QLabel(f"<b>Contract #{item['contract_id']}</b> - {item['customer']}")
-            info_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            item_layout.addWidget(info_label)
-            
-            vehicle_label = QLabel(f"Vehicle: {item['vehicle']} | Balance: ${item['balance']:.2f}")
-            item_layout.addWidget(vehicle_label)
-            
-            # Alerts
-            for alert in item['alerts']:
-                alert_label = QLabel(f"  ⚠️ {alert['deadline']}: {alert['date']} - <b>{alert['status']}</b>")
-                alert_label.setStyleSheet(f"color: {danger_color};")
-                item_layout.addWidget(alert_label)
-            
-            scroll_layout.addWidget(item_frame)
+            alerts = "".join(
+                f"<div style='color: {danger_color};'>&nbsp;&nbsp;⚠️ {html.escape(alert['deadline'])}: "
+                f"{html.escape(alert['date'])} - <b>{html.escape(alert['status'])}</b></div>"
+                for alert in item['alerts']
+            )
+            blocks.append(
+                f"<table width='100%' border='2' cellspacing='0' cellpadding='10' "
+                f"style='border-color: {danger_color}; border-style: solid; margin: 5px;'><tr><td>"
+                f"<b>Contract #{item['contract_id']}</b> - {html.escape(item['customer'])}<br>"
+                f"Vehicle: {html.escape(item['vehicle'])} | Balance: ${item['balance']:.2f}"
+                f"{alerts}</td></tr></table>"
+            )
         
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_widget)
-        layout.addWidget(scroll)
+        items_view = QTextEdit()
+        items_view.setReadOnly(True)
+        items_view.setFont(QFont("Segoe UI", 10))
+        items_view.setHtml("".join(blocks))
+        layout.addWidget(items_view)
         
         # Action buttons
         btn_layout = QHBoxLayout()
@@ -739,31 +836,31 @@ class LotAppQt(QMainWindow):
     # create_type_card moved to ui/dashboard.py module
     
     def refresh_dashboard(self):
-        """Refresh the dashboard with current data."""
-        # Store current tab to restore after refresh
-        current_tab = self.tabs.currentIndex()
-        
-        # Get the last tab index (dashboard will be added there by create_dashboard_tab)
-        last_tab_index = self.tabs.count()
+        """Refresh the dashboard with current data.
         
-        # Recreate dashboard using the theme-aware method (it adds to the end)
-        self.create_dashboard_tab()
-        
-        # Move the newly created dashboard tab from the end to position 0
-        dashboard_widget = self.tabs.widget(last_tab_index)
-        dashboard_tab_text = self.tabs.tabText(last_tab_index)
-        self.tabs.removeTab(last_tab_index)
+        When another tab is showing, the rebuild is deferred until the
+        dashboard tab is selected again (see on_tab_changed).
+        """
+        if self.tabs.currentIndex() != 0:
+            self.dashboard_stale = True
+            return
+        self.dashboard_stale = False
         
-        # Remove the old dashboard at position 0
+        # Swap the rebuilt dashboard into position 0 and free the old one
+        old_widget = self.tabs.widget(0)
+        dashboard_widget = create_dashboard_widget(self.theme_manager, self.storage_data, self)
         self.tabs.removeTab(0)
+        self.tabs.insertTab(0, dashboard_widget, "Dashboard")
+        self.tabs.setCurrentIndex(0)
+        old_widget.deleteLater()
         
-        # Insert the new dashboard at position 0
-        self.tabs.insertTab(0, dashboard_widget, dashboard_tab_text)
-        
-        # Restore the previously active tab
-        self.tabs.setCurrentIndex(current_tab)
-            
+        self.update_notification_badge()
         self.status_label.setText("Dashboard refreshed")
+    
+    def on_tab_changed(self, index: int):
+        """Rebuild a stale dashboard when its tab is shown."""
+        if index == 0 and self.dashboard_stale:
+            self.refresh_dashboard()
 
     
     def create_contracts_tab(self):
@@ -1184,7 +1281,7 @@ class LotAppQt(QMainWindow):
             # Add payments
             for payment in contract.payments:
                 try:
-                    payment_date = datetime.strptime(payment.date, "%Y-%m-%d")
+                    payment_date = parse_date(payment.date)
                     month_key = payment_date.strftime("%Y-%m")
                     
                     monthly_data[month_key][contract_type] += payment.amount
@@ -1246,7 +1343,7 @@ class LotAppQt(QMainWindow):
             if bal <= 0:
                 continue
             
-            start_date = datetime.strptime(contract.start_date, "%Y-%m-%d")
+            start_date = parse_date(contract.start_date)
             days_old = (today - start_date).days
             
             contract_info = {
@@ -1372,14 +1469,14 @@ class LotAppQt(QMainWindow):
         
         for contract in self.storage_data.contracts:
             # Count contracts started this year
-            start_date = datetime.strptime(contract.start_date, "%Y-%m-%d")
+            start_date = parse_date(contract.start_date)
             if start_date.year == current_year:
                 contracts_started += 1
             
             # Sum payments made this year
             for payment in contract.payments:
                 try:
-                    payment_date = datetime.strptime(payment.date, "%Y-%m-%d")
+                    payment_date = parse_date(payment.date)
                     if payment_date.year == current_year:
                         annual_revenue += payment.amount
                         total_payments += payment.amount
@@ -1824,12 +1921,12 @@ class LotAppQt(QMainWindow):
             QPushButton {{
                 border: none;
                 padding: 10px 15px;
-                color: {theme_colors['titlebar_fg']};
+                color: {theme_colors.titlebar_fg};
                 background-color: transparent;
                 font-size: 12px;
             }}
             QPushButton:hover {{
-                background-color: {theme_colors['button_hover']};
+                background-color: {theme_colors.button_hover};
             }}
         """
         
@@ -1838,12 +1935,12 @@ class LotAppQt(QMainWindow):
             QPushButton {{
                 border: none;
                 padding: 10px 15px;
-                color: {theme_colors['titlebar_fg']};
-                background-color: {theme_colors['button_hover']};
+                color: {theme_colors.titlebar_fg};
+                background-color: {theme_colors.button_hover};
                 font-size: 12px;
             }}
             QPushButton:hover {{
-                background-color: {theme_colors['button_hover']};
+                background-color: {theme_colors.button_hover};
             }}
         """
         
@@ -1863,12 +1960,12 @@ class LotAppQt(QMainWindow):
             QPushButton {{
                 border: none;
                 padding: 10px 15px;
-                color: {theme_colors['titlebar_fg']};
+                color: {theme_colors.titlebar_fg};
                 background-color: transparent;
                 font-size: 12px;
             }}
             QPushButton:hover {{
-                background-color: {theme_colors['button_hover']};
+                background-color: {theme_colors.button_hover};
             }}
         """
         self.title_bar.file_btn.setStyleSheet(base_style)
@@ -1878,55 +1975,67 @@ class LotAppQt(QMainWindow):
         # Menu closed, restore state
         self.menu_is_open = False
     
-    def populate_contract_row(self, row_index: int, contract: StorageContract):
-        """Populate a single contract row with status logic and styling."""
+    def populate_contract_row(self, row_index: int, contract: StorageContract, bal: float | None = None,
+                              today: datetime | None = None):
+        """Populate a single contract row with status logic and styling.
+        
+        Args:
+            row_index: Table row to fill
+            contract: Contract shown in the row
+            bal: Precomputed balance, if the caller already has it
+            today: Reference date shared by a whole table fill (default: now)
+        """
+        if today is None:
+            today = datetime.today()
+        
         # Calculate balance
-        bal = balance(contract)
+        if bal is None:
+            bal = balance(contract, today)
         vehicle = f"{contract.vehicle.vehicle_type} {contract.vehicle.plate}"
         
         # Get status information from lot_logic
         past_due, days_past_due = past_due_status(contract)
-        is_lien_eligible, lien_status_text = lien_eligibility(contract)
+        is_lien_eligible, lien_status_text = lien_eligibility(contract, today)
         timeline = lien_timeline(contract)
         is_sale_eligible = timeline.get("is_sale_eligible", False)
         
         # Calculate days in storage
-        start_dt = datetime.strptime(contract.start_date, "%Y-%m-%d")
-        today = datetime.today()
+        start_dt = parse_date(contract.start_date)
         days_stored = (today - start_dt).days
         
         # Determine next milestone for timeline display
+        contract_type = contract.contract_type.lower()
         next_milestone = ""
-        if contract.contract_type.lower() == "tow":
+        if contract_type == "tow":
             if days_stored < 7:
                 next_milestone = f"Payment due in {7 - days_stored}d"
             else:
                 next_milestone = "Payment overdue"
-        elif contract.contract_type.lower() == "recovery":
+        elif contract_type == "recovery":
             lien_notice_date = timeline.get("lien_notice_deadline")
             sale_eligible_date = timeline.get("sale_eligible_date")
             if lien_notice_date:
-                lien_dt = datetime.strptime(lien_notice_date, "%Y-%m-%d")
+                lien_dt = parse_date(lien_notice_date)
                 days_to_lien = (lien_dt - today).days
                 if days_to_lien > 0:
                     next_milestone = f"Lien notice: {days_to_lien}d"
                 elif sale_eligible_date:
-                    sale_dt = datetime.strptime(sale_eligible_date, "%Y-%m-%d")
+                    sale_dt = parse_date(sale_eligible_date)
                     days_to_sale = (sale_dt - today).days
                     if days_to_sale > 0:
                         next_milestone = f"Sale eligible: {days_to_sale}d"
                     else:
                         next_milestone = "SALE NOW"
-        elif contract.contract_type.lower() == "storage":
+        elif contract_type == "storage":
             first_notice_date = timeline.get("first_notice_date")
             lien_eligible_date = timeline.get("lien_eligible_date")
             if first_notice_date and not past_due:
-                notice_dt = datetime.strptime(first_notice_date, "%Y-%m-%d")
+                notice_dt = parse_date(first_notice_date)
                 days_to_notice = (notice_dt - today).days
                 if days_to_notice > 0:
                     next_milestone = f"1st notice: {days_to_notice}d"
             elif lien_eligible_date:
-                lien_dt = datetime.strptime(lien_eligible_date, "%Y-%m-%d")
+                lien_dt = parse_date(lien_eligible_date)
                 days_to_lien = (lien_dt - today).days
                 if days_to_lien > 0:
                     next_milestone = f"Lien eligible: {days_to_lien}d"
@@ -1944,61 +2053,139 @@ class LotAppQt(QMainWindow):
             display_status = f"✓ {contract.status}"
         
         # Add vehicle age for recovery contracts (affects timeline)
-        if contract.contract_type.lower() == "recovery" and contract.vehicle.year:
-            current_year = datetime.today().year
+        if contract_type == "recovery" and contract.vehicle.year:
+            current_year = today.year
             vehicle_age = current_year - contract.vehicle.year
             vehicle += f" ({vehicle_age}yr)"
         
-        # Create table items
-        id_item = QTableWidgetItem(str(contract.contract_id))
-        name_item = QTableWidgetItem(contract.customer.name)
-        vehicle_item = QTableWidgetItem(vehicle)
-        type_item = QTableWidgetItem(contract.contract_type)
-        date_item = QTableWidgetItem(contract.start_date)
-        balance_item = QTableWidgetItem(f"${bal:.2f}")
-        days_item = QTableWidgetItem(str(days_stored))
-        milestone_item = QTableWidgetItem(next_milestone)
-        status_item = QTableWidgetItem(display_status)
+        # Fill the row's cells, reusing the items already in the table
+        row_items = [
+            self.contract_cell(row_index, col, text)
+            for col, text in enumerate((
+                str(contract.contract_id), contract.customer.name, vehicle,
+                contract.contract_type, contract.start_date, "$%.2f" % bal,
+                str(days_stored), next_milestone, display_status,
+            ))
+        ]
+        id_item, milestone_item, status_item = row_items[0], row_items[7], row_items[8]
+        id_item.setData(Qt.ItemDataRole.UserRole, contract)
         
         # Apply color coding based on status level
         if is_sale_eligible:
-            # Blue background for sale eligible
-            for item in [id_item, name_item, vehicle_item, type_item, date_item, balance_item, days_item, milestone_item, status_item]:
-                item.setBackground(QColor("#e3f2fd"))  # Light blue
-            status_item.setForeground(QColor("#1565c0"))  # Dark blue
+            highlight = ROW_HIGHLIGHT_COLORS["sale"]
         elif is_lien_eligible:
-            # Orange background for lien eligible
-            for item in [id_item, name_item, vehicle_item, type_item, date_item, balance_item, days_item, milestone_item, status_item]:
-                item.setBackground(QColor("#fff3e0"))  # Light orange
-            status_item.setForeground(QColor("#e65100"))  # Dark orange
+            highlight = ROW_HIGHLIGHT_COLORS["lien"]
         elif past_due:
-            # Light red background for past due
-            for item in [id_item, name_item, vehicle_item, type_item, date_item, balance_item, days_item, milestone_item, status_item]:
-                item.setBackground(QColor("#ffebee"))  # Light red
-            status_item.setForeground(QColor("#c62828"))  # Dark red
+            highlight = ROW_HIGHLIGHT_COLORS["past_due"]
+        else:
+            highlight = None
+        if highlight:
+            bg_color, status_color = highlight
+            for item in row_items:
+                item.setBackground(bg_color)
+            status_item.setForeground(status_color)
         
         # Bold milestone text if urgent (< 3 days)
         if "0d" in next_milestone or "1d" in next_milestone or "2d" in next_milestone:
-            milestone_item.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            milestone_item.setForeground(QColor("#c62828"))
-        
-        # Set items in table
-        self.contract_table.setItem(row_index, 0, id_item)
-        self.contract_table.setItem(row_index, 1, name_item)
-        self.contract_table.setItem(row_index, 2, vehicle_item)
-        self.contract_table.setItem(row_index, 3, type_item)
-        self.contract_table.setItem(row_index, 4, date_item)
-        self.contract_table.setItem(row_index, 5, balance_item)
-        self.contract_table.setItem(row_index, 6, days_item)
-        self.contract_table.setItem(row_index, 7, milestone_item)
-        self.contract_table.setItem(row_index, 8, status_item)
+            if self._urgent_milestone_font is None:
+                self._urgent_milestone_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+            milestone_item.setFont(self._urgent_milestone_font)
+            milestone_item.setForeground(URGENT_MILESTONE_COLOR)
+    
+    def contract_cell(self, row: int, col: int, text: str) -> QTableWidgetItem:
+        """Return the contract table item at (row, col) showing ``text``.
+        
+        An item left by a previous fill is reused with its styling reset;
+        a new one is only created for cells that are still empty.
+        """
+        item = self.contract_table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            self.contract_table.setItem(row, col, item)
+        else:
+            item.setText(text)
+            item.setData(Qt.ItemDataRole.BackgroundRole, None)
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
+            item.setData(Qt.ItemDataRole.FontRole, None)
+        return item
+            
+    def fill_contract_table(self, contracts, balances: Optional[Dict[int, float]] = None):
+        """Rebuild the contract table from a list of contracts in one pass.
+        
+        Repaints are suspended while rows are written so the table lays out
+        once at the end instead of after every setItem call.
+        Existing cell items are updated in place; setRowCount drops any rows
+        left over from a longer previous fill.
+        
+        Args:
+            contracts: Contracts to show, in display order
+            balances: Optional precomputed balances keyed by contract_id
+        """
+        # One reference date for every row instead of a clock read per row
+        today = datetime.today()
+        if balances is None:
+            balances = contract_balances(contracts, today)
+        
+        table = self.contract_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(contracts))
+            for i, contract in enumerate(contracts):
+                self.populate_contract_row(i, contract, balances.get(contract.contract_id), today)
+        finally:
+            table.setUpdatesEnabled(True)
             
+    def contract_at_row(self, row: int) -> StorageContract:
+        """Return the contract shown in a table row.
+        
+        Each row carries its contract on the ID cell, so lookups stay correct
+        when the table shows a filtered subset of storage_data.contracts.
+        """
+        return self.contract_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+    
+    def refresh_contract_row(self, contract: StorageContract):
+        """Redraw the table row of a single changed contract.
+        
+        Edits and payments touch one contract, so only its row is rebuilt
+        instead of the whole table. Falls back to refresh_contracts if the
+        contract isn't currently shown.
+        """
+        table = self.contract_table
+        for row in range(table.rowCount()):
+            if self.contract_at_row(row) is contract:
+                break
+        else:
+            self.refresh_contracts()
+            return
+        
+        # Its search key may be stale now
+        self.search_index = {}
+        
+        self.populate_contract_row(row, contract)
+        
+        self.on_contract_selected()
+        self.update_notification_badge()
+    
+    @staticmethod
+    def contract_search_key(contract: StorageContract) -> str:
+        """Lowercased searchable fields of a contract, NUL-separated so a match never spans two fields."""
+        return "\0".join((
+            contract.customer.name.lower(),
+            (contract.customer.phone or "").lower(),
+            contract.vehicle.vehicle_type.lower(),
+            contract.vehicle.make.lower(),
+            contract.vehicle.model.lower(),
+            contract.vehicle.plate.lower(),
+            (contract.vehicle.vin or "").lower(),
+            str(contract.contract_id),
+        ))
+    
     def refresh_contracts(self):
         """Refresh the contract table only."""
-        self.contract_table.setRowCount(len(self.storage_data.contracts))
-        
-        for i, contract in enumerate(self.storage_data.contracts):
-            self.populate_contract_row(i, contract)
+        # Drop the search index whenever the underlying contracts may have changed;
+        # apply_filters rebuilds it the next time a search actually runs
+        self.search_index = {}
+        self.fill_contract_table(self.storage_data.contracts)
         
         # Update dashboard notification badge
         self.update_notification_badge()
@@ -2017,10 +2204,17 @@ class LotAppQt(QMainWindow):
         
         if not selected_rows:
             self.summary_text.clear()
+            self._summary_cache = None
             return
             
         row = selected_rows[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
+        
+        # Selection changes fire on every cell click; keep the summary already
+        # on screen while the same contract stays selected and unchanged
+        summary_key = self.summary_cache_key(contract)
+        if self._summary_cache and self._summary_cache[0] == summary_key:
+            return
         
         # Get status information
         past_due, days_past_due = past_due_status(contract)
@@ -2028,6 +2222,8 @@ class LotAppQt(QMainWindow):
         timeline = lien_timeline(contract)
         is_sale_eligible = timeline.get("is_sale_eligible", False)
         
+        bal = balance(contract)
+        
         # Build prominent status badge at top
         status_header = "=" * 60 + "\n"
         if is_sale_eligible:
@@ -2036,14 +2232,14 @@ class LotAppQt(QMainWindow):
             status_header += f"🟠 STATUS: LIEN ELIGIBLE - {lien_status.upper()}\n"
         elif past_due:
             status_header += f"🔴 STATUS: PAST DUE - {days_past_due} DAYS OVERDUE\n"
-        elif balance(contract) == 0:
+        elif bal == 0:
             status_header += "✅ STATUS: PAID IN FULL\n"
         else:
-            status_header += f"✅ STATUS: CURRENT - Balance ${balance(contract):.2f}\n"
+            status_header += f"✅ STATUS: CURRENT - Balance ${bal:.2f}\n"
         status_header += "=" * 60 + "\n\n"
         
-        # Get basic contract summary
-        summary = format_contract_summary(contract)
+        # Get basic contract summary, reusing the timeline and lien status above
+        summary = format_contract_summary(contract, lien_dates=timeline, lien_status=lien_status)
         
         # Build lien & sale timeline section
         timeline_section = "\n\n" + "="*60 + "\n"
@@ -2134,6 +2330,28 @@ class LotAppQt(QMainWindow):
         # Combine and display with status badge at top
         full_summary = status_header + summary + timeline_section
         self.summary_text.setText(full_summary)
+        self._summary_cache = (summary_key, summary)
+    
+    def summary_cache_key(self, contract: StorageContract) -> tuple:
+        """Identify what a contract's summary depends on.
+        
+        The data revision changes on every save, so edits, payments and
+        attachment changes all invalidate the summary without each having to
+        clear the cache. The minute covers statuses that change with time of
+        day, such as the tow storage exemption.
+        """
+        return (
+            contract.contract_id,
+            self.storage_data.revision,
+            datetime.now().replace(second=0, microsecond=0),
+        )
+    
+    def contract_summary_text(self, contract: StorageContract) -> str:
+        """Return format_contract_summary for a contract, reusing the summary pane's copy when current."""
+        cached = self._summary_cache
+        if cached and cached[0] == self.summary_cache_key(contract):
+            return cached[1]
+        return format_contract_summary(contract)
     
     def show_contract_context_menu(self, position):
         """Show context menu for contract table."""
@@ -2186,15 +2404,11 @@ class LotAppQt(QMainWindow):
         # Search text filter (multi-field)
         search_text = self.search_input.text().strip().lower()
         if search_text:
-            filtered = [c for c in filtered 
-                       if search_text in c.customer.name.lower() or
-                          search_text in (c.customer.phone or "").lower() or
-                          search_text in c.vehicle.vehicle_type.lower() or
-                          search_text in c.vehicle.make.lower() or
-                          search_text in c.vehicle.model.lower() or
-                          search_text in c.vehicle.plate.lower() or
-                          search_text in (c.vehicle.vin or "").lower() or
-                          search_text in str(c.contract_id)]
+            if not self.search_index:
+                self.search_index = {c.contract_id: self.contract_search_key(c) for c in self.storage_data.contracts}
+            search_index = self.search_index
+            filtered = [c for c in filtered
+                       if search_text in (search_index.get(c.contract_id) or self.contract_search_key(c))]
             active_filters.append(f"Search: '{search_text}'")
         
         # Contract type filter
@@ -2203,43 +2417,47 @@ class LotAppQt(QMainWindow):
             filtered = [c for c in filtered if c.contract_type.lower() == type_filter.lower()]
             active_filters.append(f"Type: {type_filter}")
         
-        # Status filter
-        status_filter = self.status_filter.currentText()
-        if status_filter != "All Status":
-            if status_filter == "Active":
-                filtered = [c for c in filtered if c.status != "Paid" and balance(c) > 0]
-            elif status_filter == "Paid":
-                filtered = [c for c in filtered if c.status == "Paid" or balance(c) == 0]
-            elif status_filter == "Past Due":
-                filtered = [c for c in filtered if past_due_status(c)[0]]
-            elif status_filter == "Lien Eligible":
-                filtered = [c for c in filtered if lien_eligibility(c)[0]]
-            elif status_filter == "Sale Eligible":
-                filtered = [c for c in filtered if lien_timeline(c).get("is_sale_eligible", False)]
-            active_filters.append(f"Status: {status_filter}")
-        
-        # Date range filter
+        # Date range filter (cheap, so it runs before any balance/status work)
         date_from = self.date_from.text().strip()
         date_to = self.date_to.text().strip()
         
-        if date_from:
+        if date_from and DATE_INPUT_RE.fullmatch(date_from):
             try:
-                from_date = datetime.strptime(date_from, "%Y-%m-%d")
+                from_date = parse_date(date_from)
                 filtered = [c for c in filtered 
-                           if datetime.strptime(c.start_date, "%Y-%m-%d") >= from_date]
+                           if parse_date(c.start_date) >= from_date]
                 active_filters.append(f"From: {date_from}")
             except ValueError:
                 pass  # Invalid date format, skip filter
         
-        if date_to:
+        if date_to and DATE_INPUT_RE.fullmatch(date_to):
             try:
-                to_date = datetime.strptime(date_to, "%Y-%m-%d")
+                to_date = parse_date(date_to)
                 filtered = [c for c in filtered 
-                           if datetime.strptime(c.start_date, "%Y-%m-%d") <= to_date]
+                           if parse_date(c.start_date) <= to_date]
                 active_filters.append(f"To: {date_to}")
             except ValueError:
                 pass  # Invalid date format, skip filter
         
+        # Balances for the rows still in play, computed once and shared with
+        # the status filter and the table fill below
+        balances = contract_balances(filtered)
+        
+        # Status filter
+        status_filter = self.status_filter.currentText()
+        if status_filter != "All Status":
+            if status_filter == "Active":
+                filtered = [c for c in filtered if c.status != "Paid" and balances[c.contract_id] > 0]
+            elif status_filter == "Paid":
+                filtered = [c for c in filtered if c.status == "Paid" or balances[c.contract_id] == 0]
+            elif status_filter == "Past Due":
+                filtered = [c for c in filtered if past_due_status(c)[0]]
+            elif status_filter == "Lien Eligible":
+                filtered = [c for c in filtered if lien_eligibility(c)[0]]
+            elif status_filter == "Sale Eligible":
+                filtered = [c for c in filtered if lien_timeline(c).get("is_sale_eligible", False)]
+            active_filters.append(f"Status: {status_filter}")
+        
         # Update filter count label
         if active_filters:
             self.filter_count_label.setText(f"✓ {len(active_filters)} filter(s) active | Showing {len(filtered)} of {len(self.storage_data.contracts)} contracts")
@@ -2247,17 +2465,25 @@ class LotAppQt(QMainWindow):
             self.filter_count_label.setText(f"Showing all {len(filtered)} contracts")
         
         # Update table
-        self.contract_table.setRowCount(len(filtered))
-        for i, contract in enumerate(filtered):
-            self.populate_contract_row(i, contract)
+        self.fill_contract_table(filtered, balances)
     
     def clear_filters(self):
         """Clear all active filters."""
-        self.search_input.clear()
-        self.type_filter.setCurrentIndex(0)
-        self.status_filter.setCurrentIndex(0)
-        self.date_from.clear()
-        self.date_to.clear()
+        # Each reset would otherwise fire its own change signal and rebuild
+        # the table; silence them and rebuild once at the end
+        filter_widgets = (self.search_input, self.type_filter, self.status_filter,
+                          self.date_from, self.date_to)
+        for widget in filter_widgets:
+            widget.blockSignals(True)
+        try:
+            self.search_input.clear()
+            self.type_filter.setCurrentIndex(0)
+            self.status_filter.setCurrentIndex(0)
+            self.date_from.clear()
+            self.date_to.clear()
+        finally:
+            for widget in filter_widgets:
+                widget.blockSignals(False)
         self.apply_filters()
     
     def edit_contract(self):
@@ -2268,7 +2494,7 @@ class LotAppQt(QMainWindow):
             return
         
         row = selected_rows[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
         
         # Create edit dialog
         dialog = ContractEditDialog(contract, self.fee_templates, self)
@@ -2276,11 +2502,11 @@ class LotAppQt(QMainWindow):
             # Get updated contract
             updated_contract = dialog.get_contract()
             # Replace in list
-            self.storage_data.contracts[row] = updated_contract
+            self.storage_data.contracts[self.storage_data.contracts.index(contract)] = updated_contract
             # Save
             save_data(self.storage_data)
             # Refresh display
-            self.refresh_contracts()
+            self.refresh_contract_row(updated_contract)
             QMessageBox.information(self, "Success", f"Contract #{contract.contract_id} updated successfully!")
     
     def record_payment(self):
@@ -2291,7 +2517,7 @@ class LotAppQt(QMainWindow):
             return
         
         row = selected_rows[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
         current_balance = balance(contract)
         
         if current_balance <= 0:
@@ -2365,7 +2591,7 @@ class LotAppQt(QMainWindow):
                 
                 # Save
                 save_data(self.storage_data)
-                self.refresh_contracts()
+                self.refresh_contract_row(contract)
                 
                 # Show receipt
                 receipt = f"PAYMENT RECEIPT\\n{'='*40}\\n"
@@ -2393,7 +2619,7 @@ class LotAppQt(QMainWindow):
             return
         
         row = selected_rows[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
         
         # Check if lien eligible
         is_eligible, status = lien_eligibility(contract)
@@ -2508,73 +2734,32 @@ class LotAppQt(QMainWindow):
         if not filename:
             return
         
-        try:
-            # Get business info from settings
-            business_name = self.settings_manager.get('business_name', '')
-            report_footer = self.settings_manager.get('report_footer_text', '')
-            
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                # Business header if available
-                if business_name:
-                    writer.writerow([business_name])
-                    writer.writerow([f"Export Date: {datetime.today().strftime('%B %d, %Y')}"])
-                    writer.writerow([])  # Blank row
-                
-                # Column headers
-                writer.writerow(['ID', 'Customer Name', 'Phone', 'Vehicle Type', 'Make', 'Model', 
-                               'Year', 'Plate', 'VIN', 'Contract Type', 'Start Date', 'Rate Mode',
-                               'Daily Fee', 'Weekly Fee', 'Monthly Fee', 'Balance', 'Status', 
-                               'Days in Storage', 'Lien Eligible', 'Sale Eligible'])
-                
-                # Data rows
-                for contract in self.storage_data.contracts:
-                    bal = balance(contract)
-                    is_lien_eligible, _ = lien_eligibility(contract)
-                    timeline = lien_timeline(contract)
-                    is_sale_eligible = timeline.get("is_sale_eligible", False)
-                    
-                    start_dt = datetime.strptime(contract.start_date, "%Y-%m-%d")
-                    days_stored = (datetime.today() - start_dt).days
-                    
-                    writer.writerow([
-                        contract.contract_id,
-                        contract.customer.name,
-                        contract.customer.phone,
-                        contract.vehicle.vehicle_type,
-                        contract.vehicle.make,
-                        contract.vehicle.model,
-                        contract.vehicle.year or '',
-                        contract.vehicle.plate,
-                        contract.vehicle.vin or '',
-                        contract.contract_type,
-                        contract.start_date,
-                        contract.rate_mode,
-                        contract.daily_storage_fee,
-                        contract.weekly_storage_fee,
-                        contract.monthly_storage_fee,
-                        f"{bal:.2f}",
-                        contract.status,
-                        days_stored,
-                        'Yes' if is_lien_eligible else 'No',
-                        'Yes' if is_sale_eligible else 'No'
-                    ])
-                
-                # Add legal disclaimers
-                writer.writerow([])  # Blank row
-                writer.writerow(["NOTICE: This document is for informational purposes only and is not a lien notice."])
-                writer.writerow(["All amounts shown are subject to Florida law and may be adjusted. This is not a final bill."])
-                
-                # Add footer if configured
-                if report_footer:
-                    writer.writerow([])  # Blank row
-                    writer.writerow([report_footer])
-            
-            QMessageBox.information(self, "Success", f"Exported {len(self.storage_data.contracts)} contracts to {filename}")
+        # Build the rows here, where the contracts are only ever changed, and
+        # hand the worker plain tuples to write off the UI thread
+        rows = _contract_csv_rows(self.storage_data.contracts, datetime.today())
+        future = self._export_executor.submit(
+            _write_contracts_csv, filename, rows,
+            self.settings_manager.get('business_name', ''),
+            self.settings_manager.get('report_footer_text', '')
+        )
         
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+        def report(f):
+            exc = f.exception()
+            self.export_finished.emit(
+                filename, len(rows), exc is None, "" if exc is None else (str(exc) or repr(exc))
+            )
+        
+        future.add_done_callback(report)
+        self.status_label.setText(f"Exporting {len(rows)} contracts...")
+    
+    def on_export_finished(self, filename: str, count: int, ok: bool, error: str):
+        """Report the result of a background CSV export."""
+        if not ok:
+            self.status_label.setText("Export failed")
+            QMessageBox.critical(self, "Error", f"Failed to export: {error}")
+        else:
+            self.status_label.setText(f"Exported {count} contracts")
+            QMessageBox.information(self, "Success", f"Exported {count} contracts to {filename}")
     
     def print_contract_summary(self):
         """Print detailed summary of selected contract."""
@@ -2584,10 +2769,10 @@ class LotAppQt(QMainWindow):
             return
         
         row = selected_rows[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
         
-        # Get detailed summary
-        summary = format_contract_summary(contract)
+        # Get detailed summary, reusing the one already built for the summary pane
+        summary = self.contract_summary_text(contract)
         timeline = lien_timeline(contract)
         
         # Get business info and footer from settings
@@ -2652,12 +2837,12 @@ class LotAppQt(QMainWindow):
                                                      "Text Files (*.txt)")
             if filename:
                 with open(filename, 'w') as f:
-                    f.write(text_edit.toPlainText())
+                    f.write(doc)
                 QMessageBox.information(dialog, "Saved", f"Summary saved to {filename}")
         
         def copy_doc():
             clipboard = QApplication.clipboard()
-            clipboard.setText(text_edit.toPlainText())
+            clipboard.setText(doc)
             QMessageBox.information(dialog, "Copied", "Summary copied to clipboard")
         
         save_btn.clicked.connect(save_doc)
@@ -2673,13 +2858,13 @@ class LotAppQt(QMainWindow):
             fee = float(self.admin_fee.text() or 0)
             if fee > MAX_ADMIN_FEE:
                 self.admin_fee_warning.setText(f"⚠ WARNING: Exceeds FL cap of ${MAX_ADMIN_FEE:.2f}")
-                self.admin_fee.setStyleSheet("border: 2px solid #d32f2f;")
+                _set_style_if_changed(self.admin_fee, "border: 2px solid #d32f2f;")
             else:
                 self.admin_fee_warning.setText("")
-                self.admin_fee.setStyleSheet(f"border: 2px solid {colors['accent']};")
+                _set_style_if_changed(self.admin_fee, f"border: 2px solid {colors.accent};")
         except ValueError:
             self.admin_fee_warning.setText("")
-            self.admin_fee.setStyleSheet(f"border: 2px solid {colors['accent']};")
+            _set_style_if_changed(self.admin_fee, f"border: 2px solid {colors.accent};")
     
     def validate_lien_fee(self):
         """Validate lien processing fee doesn't exceed Florida cap."""
@@ -2691,17 +2876,17 @@ class LotAppQt(QMainWindow):
             
             if fee > MAX_LIEN_FEE:
                 self.lien_fee_warning.setText(f"❌ CRITICAL: Lien fee exceeds ${MAX_LIEN_FEE:.2f} FL cap")
-                self.lien_processing_fee.setStyleSheet("border: 2px solid #d32f2f;")
+                _set_style_if_changed(self.lien_processing_fee, "border: 2px solid #d32f2f;")
             elif total > MAX_LIEN_FEE:
                 self.lien_fee_warning.setText(f"❌ CRITICAL: Admin+Lien (${total:.2f}) exceeds ${MAX_LIEN_FEE:.2f} cap")
-                self.lien_processing_fee.setStyleSheet("border: 2px solid #d32f2f;")
+                _set_style_if_changed(self.lien_processing_fee, "border: 2px solid #d32f2f;")
             else:
                 self.lien_fee_warning.setText("✓ Compliant")
-                self.lien_fee_warning.setStyleSheet("color: #2e7d32; font-weight: bold;")
-                self.lien_processing_fee.setStyleSheet(f"border: 2px solid {colors['accent']};")
+                _set_style_if_changed(self.lien_fee_warning, "color: #2e7d32; font-weight: bold;")
+                _set_style_if_changed(self.lien_processing_fee, f"border: 2px solid {colors.accent};")
         except ValueError:
             self.lien_fee_warning.setText("")
-            self.lien_processing_fee.setStyleSheet(f"border: 2px solid {colors['accent']};")
+            _set_style_if_changed(self.lien_processing_fee, f"border: 2px solid {colors.accent};")
     
     def validate_vin(self):
         colors = get_theme_colors(self.current_theme)
@@ -2712,7 +2897,7 @@ class LotAppQt(QMainWindow):
         
         if not vin:
             self.vin_warning.setText("")
-            self.vehicle_vin.setStyleSheet(f"border: 2px solid {colors['accent']};")
+            _set_style_if_changed(self.vehicle_vin, f"border: 2px solid {colors.accent};")
             return
         
         # VIN validation rules
@@ -2723,17 +2908,17 @@ class LotAppQt(QMainWindow):
         
         if has_invalid:
             self.vin_warning.setText("⚠ VIN cannot contain I, O, or Q")
-            self.vehicle_vin.setStyleSheet("border: 2px solid #ff9800;")
+            _set_style_if_changed(self.vehicle_vin, "border: 2px solid #ff9800;")
         elif not is_alphanumeric:
             self.vin_warning.setText("⚠ VIN must be alphanumeric only")
-            self.vehicle_vin.setStyleSheet("border: 2px solid #ff9800;")
+            _set_style_if_changed(self.vehicle_vin, "border: 2px solid #ff9800;")
         elif length < 17:
             self.vin_warning.setText(f"⚠ VIN must be 17 characters ({length}/17)")
-            self.vehicle_vin.setStyleSheet("border: 2px solid #ff9800;")
+            _set_style_if_changed(self.vehicle_vin, "border: 2px solid #ff9800;")
         else:
             self.vin_warning.setText("✓ Valid VIN")
-            self.vin_warning.setStyleSheet("color: #2e7d32; font-size: 10px;")
-            self.vehicle_vin.setStyleSheet("border: 2px solid #2e7d32;")
+            _set_style_if_changed(self.vin_warning, "color: #2e7d32; font-size: 10px;")
+            _set_style_if_changed(self.vehicle_vin, "border: 2px solid #2e7d32;")
     
     def format_phone_number(self):
         """Auto-format phone number to (XXX) XXX-XXXX."""
@@ -2764,14 +2949,14 @@ class LotAppQt(QMainWindow):
         colors = get_theme_colors(self.current_theme)
         if digits and len(digits) < 10:
             self.phone_warning.setText(f"⚠ Phone must be 10 digits ({len(digits)}/10)")
-            self.customer_phone.setStyleSheet("border: 2px solid #ff9800;")
+            _set_style_if_changed(self.customer_phone, "border: 2px solid #ff9800;")
         elif digits and len(digits) == 10:
             self.phone_warning.setText("✓ Valid phone")
-            self.phone_warning.setStyleSheet("color: #2e7d32; font-size: 10px;")
-            self.customer_phone.setStyleSheet("border: 2px solid #2e7d32;")
+            _set_style_if_changed(self.phone_warning, "color: #2e7d32; font-size: 10px;")
+            _set_style_if_changed(self.customer_phone, "border: 2px solid #2e7d32;")
         else:
             self.phone_warning.setText("")
-            self.customer_phone.setStyleSheet(f"border: 2px solid {colors['accent']};")
+            _set_style_if_changed(self.customer_phone, f"border: 2px solid {colors.accent};")
     
     def format_license_plate(self):
         """Auto-uppercase license plate and validate."""
@@ -2969,13 +3154,7 @@ class LotAppQt(QMainWindow):
             if contract.lien_processing_fee > 250:
                 warnings.append(f"⚠️ Lien processing fee ${contract.lien_processing_fee:.2f} exceeds FL maximum of $250")
             
-            # Display warnings but don't block creation
-            if warnings:
-                warning_msg = "Contract created with warnings:\n\n" + "\n".join(warnings)
-                QMessageBox.warning(self, "Fee Warnings", warning_msg)
-            
             # Add audit log entry for contract creation
-            from logic.lot_logic import add_audit_entry
             user = "System"  # Could be configurable per user if multi-user
             add_audit_entry(
                 contract,
@@ -2983,11 +3162,15 @@ class LotAppQt(QMainWindow):
                 f"Type: {contract.contract_type.title()}, Customer: {customer.name}, Vehicle: {vehicle.year or ''} {vehicle.make} {vehicle.model} ({vehicle.plate}), Created by: {user}"
             )
             
-            self.storage_data.contracts.append(contract)
-            self.storage_data.next_id += 1
+            add_contracts(self.storage_data, [contract])
             save_data(self.storage_data)
             
-            QMessageBox.information(self, "Success", f"Contract #{contract.contract_id} created successfully!")
+            # Report success and any warnings in a single dialog; warnings don't block creation
+            if warnings:
+                warning_msg = f"Contract #{contract.contract_id} created with warnings:\n\n" + "\n".join(warnings)
+                QMessageBox.warning(self, "Fee Warnings", warning_msg)
+            else:
+                QMessageBox.information(self, "Success", f"Contract #{contract.contract_id} created successfully!")
             self.clear_intake_form()
             self.refresh_contracts()
             self.tabs.setCurrentIndex(0)
@@ -3080,7 +3263,7 @@ class LotAppQt(QMainWindow):
             return
         
         row = selected_rows[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
         
         # Get business info from settings
         business_name = self.settings_manager.get('business_name', 'Storage Lot')
@@ -3092,29 +3275,33 @@ class LotAppQt(QMainWindow):
         record = format_contract_record(contract)
         bal = balance(contract)
         
-        # Build printable document
-        doc = business_name + "\\n"
-        if business_address:
-            doc += business_address + "\\n"
-        if business_phone:
-            doc += f"Phone: {business_phone}\\n"
-        doc += "\\n"
-        doc += "CONTRACT RECORD\\n"
-        doc += "="*70 + "\\n"
-        doc += f"Printed: {datetime.today().strftime('%B %d, %Y at %I:%M %p')}\\n"
-        doc += "="*70 + "\\n\\n"
-        doc += record
-        doc += "\\n" + "="*70 + "\\n"
-        doc += f"CURRENT BALANCE: ${bal:.2f}\\n"
-        
-        # Add legal disclaimers
-        doc += "\\n" + "="*70 + "\\n"
-        doc += "NOTICE: This document is for informational purposes only and\\n"
-        doc += "is not a lien notice. All amounts shown are subject to Florida\\n"
-        doc += "law and may be adjusted. This is not a final bill.\\n"
+        # Build printable document in one join; the preview, save and copy
+        # all reuse this string
+        def record_parts():
+            yield business_name + "\\n"
+            if business_address:
+                yield business_address + "\\n"
+            if business_phone:
+                yield f"Phone: {business_phone}\\n"
+            yield "\\n"
+            yield "CONTRACT RECORD\\n"
+            yield "="*70 + "\\n"
+            yield f"Printed: {datetime.today().strftime('%B %d, %Y at %I:%M %p')}\\n"
+            yield "="*70 + "\\n\\n"
+            yield record
+            yield "\\n" + "="*70 + "\\n"
+            yield f"CURRENT BALANCE: ${bal:.2f}\\n"
+            
+            # Add legal disclaimers
+            yield "\\n" + "="*70 + "\\n"
+            yield "NOTICE: This document is for informational purposes only and\\n"
+            yield "is not a lien notice. All amounts shown are subject to Florida\\n"
+            yield "law and may be adjusted. This is not a final bill.\\n"
+            
+            if report_footer:
+                yield "\\n" + report_footer + "\\n"
         
-        if report_footer:
-            doc += "\\n" + report_footer + "\\n"
+        doc = "".join(record_parts())
         
         # Show print dialog
         dialog = QDialog(self)
@@ -3143,12 +3330,12 @@ class LotAppQt(QMainWindow):
                                                      "Text Files (*.txt)")
             if filename:
                 with open(filename, 'w') as f:
-                    f.write(text_edit.toPlainText())
+                    f.write(doc)
                 QMessageBox.information(dialog, "Saved", f"Record saved to {filename}")
         
         def copy_doc():
             clipboard = QApplication.clipboard()
-            clipboard.setText(text_edit.toPlainText())
+            clipboard.setText(doc)
             QMessageBox.information(dialog, "Copied", "Record copied to clipboard")
         
         save_btn.clicked.connect(save_doc)
@@ -3217,7 +3404,7 @@ class LotAppQt(QMainWindow):
             return
         
         row = selected[0].row()
-        contract = self.storage_data.contracts[row]
+        contract = self.contract_at_row(row)
         
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Manage Attachments - Contract #{contract.contract_id}")
@@ -3227,7 +3414,6 @@ class LotAppQt(QMainWindow):
         dialog.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Dialog)
         
         # Ensure dialog uses application theme
-        from PyQt6.QtWidgets import QApplication
         dialog.setStyleSheet(QApplication.instance().styleSheet())
         
         # Main layout with no margins for frameless window
@@ -3238,7 +3424,7 @@ class LotAppQt(QMainWindow):
         # Custom title bar
         title_bar = QWidget()
         colors = get_theme_colors(self.current_theme)
-        title_bar.setStyleSheet(f"background-color: {colors['titlebar_bg']}; border-bottom: 1px solid {colors['border']};")
+        title_bar.setStyleSheet(f"background-color: {colors.titlebar_bg}; border-bottom: 1px solid {colors.border};")
         title_bar.setFixedHeight(40)
         title_bar_layout = QHBoxLayout(title_bar)
         title_bar_layout.setContentsMargins(10, 0, 5, 0)
@@ -3258,7 +3444,7 @@ class LotAppQt(QMainWindow):
         
         title_label = QLabel(f"📎 Manage Attachments - Contract #{contract.contract_id}")
         title_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {colors['titlebar_fg']}; border: none;")
+        title_label.setStyleSheet(f"color: {colors.titlebar_fg}; border: none;")
         title_bar_layout.addWidget(title_label)
         title_bar_layout.addStretch()
         
@@ -3267,7 +3453,7 @@ class LotAppQt(QMainWindow):
         close_title_btn.setStyleSheet(f"""
             QPushButton {{
                 background: transparent;
-                color: {colors['titlebar_fg']};
+                color: {colors.titlebar_fg};
                 border: none;
                 font-size: 16px;
             }}
@@ -3296,21 +3482,20 @@ class LotAppQt(QMainWindow):
         list_widget = QListWidget()
         list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         list_widget.setAlternatingRowColors(True)
-        
-        # Populate existing attachments
-        import os
-        for attachment in contract.attachments:
-            # Show filename and file size if exists
-            if os.path.exists(attachment):
-                size = os.path.getsize(attachment)
-                size_str = self.format_file_size(size)
-                ext = os.path.splitext(attachment)[1].upper()
-                icon = self.get_file_icon(ext)
-                item = QListWidgetItem(f"{icon} {os.path.basename(attachment)} ({size_str})")
-            else:
-                item = QListWidgetItem(f"❌ {os.path.basename(attachment)} (File not found)")
-            item.setData(Qt.ItemDataRole.UserRole, attachment)
-            list_widget.addItem(item)
+        # Every entry is one line of text, so the view can size rows from the
+        # first one and lay out long lists in batches as they scroll into view
+        list_widget.setUniformItemSizes(True)
+        list_widget.setLayoutMode(QListWidget.LayoutMode.Batched)
+        
+        # Populate existing attachments once the dialog is on screen, so the
+        # window frame and buttons show up before a long list is built
+        def populate_attachments():
+            list_widget.setUpdatesEnabled(False)
+            try:
+                for attachment in contract.attachments:
+                    list_widget.addItem(self.attachment_list_item(attachment))
+            finally:
+                list_widget.setUpdatesEnabled(True)
         
         layout.addWidget(list_widget)
         
@@ -3346,13 +3531,11 @@ class LotAppQt(QMainWindow):
         # Add content widget to main layout
         main_layout.addWidget(content_widget)
         
+        QTimer.singleShot(0, populate_attachments)
         dialog.exec()
     
     def add_attachments(self, contract, list_widget, dialog):
         """Add files to contract attachments."""
-        import os
-        import shutil
-        from pathlib import Path
         
         files, _ = QFileDialog.getOpenFileNames(
             dialog,
@@ -3364,15 +3547,14 @@ class LotAppQt(QMainWindow):
         if not files:
             return
         
-        # Create attachments directory if it doesn't exist
-        attachments_dir = Path("attachments")
-        attachments_dir.mkdir(exist_ok=True)
-        
-        # Contract-specific subdirectory
-        contract_dir = attachments_dir / f"contract_{contract.contract_id}"
-        contract_dir.mkdir(exist_ok=True)
+        # Contract-specific attachments directory (created along with its parent)
+        contract_dir = Path("attachments") / f"contract_{contract.contract_id}"
+        contract_dir.mkdir(parents=True, exist_ok=True)
         
-        added_count = 0
+        # Copy every file first, then record the whole batch: one extend of the
+        # contract's list, one list widget update and a single save_data
+        existing = set(contract.attachments)
+        new_paths = []
         for file_path in files:
             try:
                 # Copy file to attachments directory
@@ -3388,38 +3570,31 @@ class LotAppQt(QMainWindow):
                 
                 shutil.copy2(file_path, dest_path)
                 
-                # Add to contract attachments
                 attachment_path = str(dest_path)
-                if attachment_path not in contract.attachments:
-                    contract.attachments.append(attachment_path)
-                    
-                    # Add to list widget
-                    size = os.path.getsize(attachment_path)
-                    size_str = self.format_file_size(size)
-                    ext = os.path.splitext(attachment_path)[1].upper()
-                    icon = self.get_file_icon(ext)
-                    item = QListWidgetItem(f"{icon} {os.path.basename(attachment_path)} ({size_str})")
-                    item.setData(Qt.ItemDataRole.UserRole, attachment_path)
-                    list_widget.addItem(item)
-                    
-                    added_count += 1
-                    
-                    # Add audit log entry
-                    from logic.lot_logic import add_audit_entry
-                    add_audit_entry(contract, "Attachment Added", f"File: {os.path.basename(attachment_path)}")
+                if attachment_path not in existing:
+                    existing.add(attachment_path)
+                    new_paths.append(attachment_path)
                     
             except Exception as e:
                 QMessageBox.warning(dialog, "Error", f"Failed to attach {os.path.basename(file_path)}: {str(e)}")
         
-        if added_count > 0:
-            save_data(self.storage_data)
-            QMessageBox.information(dialog, "Success", f"Added {added_count} file(s) to contract attachments.")
+        if not new_paths:
+            return
+        
+        contract.attachments.extend(new_paths)
+        list_widget.setUpdatesEnabled(False)
+        try:
+            for attachment_path in new_paths:
+                list_widget.addItem(self.attachment_list_item(attachment_path))
+                add_audit_entry(contract, "Attachment Added", f"File: {os.path.basename(attachment_path)}")
+        finally:
+            list_widget.setUpdatesEnabled(True)
+        
+        save_data(self.storage_data)
+        QMessageBox.information(dialog, "Success", f"Added {len(new_paths)} file(s) to contract attachments.")
     
     def view_attachment(self, list_widget):
         """Open selected attachment with default system application."""
-        import os
-        import subprocess
-        import platform
         
         selected_items = list_widget.selectedItems()
         if not selected_items:
@@ -3434,18 +3609,12 @@ class LotAppQt(QMainWindow):
         
         try:
             # Open with default application
-            if platform.system() == 'Darwin':  # macOS
-                subprocess.call(('open', attachment_path))
-            elif platform.system() == 'Windows':
-                os.startfile(attachment_path)
-            else:  # Linux
-                subprocess.call(('xdg-open', attachment_path))
+            _open_path(attachment_path)
         except Exception as e:
             QMessageBox.critical(None, "Error", f"Failed to open file: {str(e)}")
     
     def remove_attachment(self, contract, list_widget, dialog):
         """Remove selected attachment from contract."""
-        import os
         
         selected_items = list_widget.selectedItems()
         if not selected_items:
@@ -3466,14 +3635,27 @@ class LotAppQt(QMainWindow):
             if attachment_path in contract.attachments:
                 contract.attachments.remove(attachment_path)
                 list_widget.takeItem(list_widget.row(selected_items[0]))
-                save_data(self.storage_data)
                 
-                # Add audit log entry
-                from logic.lot_logic import add_audit_entry
+                # Log the removal before saving so both land in the same write
                 add_audit_entry(contract, "Attachment Removed", f"File: {filename}")
+                save_data(self.storage_data)
                 
                 QMessageBox.information(dialog, "Removed", f"Removed '{filename}' from contract attachments.")
     
+    def attachment_list_item(self, attachment_path: str) -> QListWidgetItem:
+        """Build the attachments list entry for a file: icon, name and size."""
+        # Show filename and file size if exists
+        if os.path.exists(attachment_path):
+            size = os.path.getsize(attachment_path)
+            size_str = self.format_file_size(size)
+            ext = os.path.splitext(attachment_path)[1].upper()
+            icon = self.get_file_icon(ext)
+            item = QListWidgetItem(f"{icon} {os.path.basename(attachment_path)} ({size_str})")
+        else:
+            item = QListWidgetItem(f"❌ {os.path.basename(attachment_path)} (File not found)")
+        item.setData(Qt.ItemDataRole.UserRole, attachment_path)
+        return item
+    
     def format_file_size(self, size_bytes):
         """Format file size in human-readable format."""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -3576,11 +3758,18 @@ class LotAppQt(QMainWindow):
     
     def show_fee_settings(self):
         """Show settings dialog for fee templates."""
-        from utils.persistence import load_fee_templates
-        dialog = SettingsDialog(self, self.fee_templates, self.current_theme)
+        # Reuse the dialog from the last open while the theme it was styled
+        # for is still current; reloading the table drops any cancelled edits
+        dialog = self._fee_dialog
+        if dialog is None or dialog.current_theme != self.current_theme:
+            if dialog is not None:
+                dialog.deleteLater()  # Styled for the old theme
+            dialog = self._fee_dialog = SettingsDialog(self, self.fee_templates, self.current_theme)
+        else:
+            dialog.refresh_fee_table()
         if dialog.exec():
-            # Reload fee templates after saving
-            self.fee_templates = load_fee_templates()
+            # The dialog edits self.fee_templates in place before saving, so the
+            # shared templates are already current - no need to re-read the file
             self.status_label.setText("Settings updated successfully")
         
     # Theme management methods moved to ui/theme_manager.py
@@ -1,12 +1,37 @@
 """Data models for the Storage & Recovery Lot program."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
 from typing import Any, Dict, List, Optional
 
 DATE_FORMAT = "%Y-%m-%d"
 
+# Source of StorageData revisions, unique across every data set in the process
+_revisions = count(1)
+
+
+@lru_cache(maxsize=1024)
+def parse_date(date_str: str) -> datetime:
+    """Parse a DATE_FORMAT (YYYY-MM-DD) string.
+    
+    datetime.fromisoformat handles the stored format directly and is far
+    cheaper than strptime, but it also accepts times and compact forms such
+    as 20240105, so it is only tried on strings shaped like YYYY-MM-DD.
+    Everything else goes through strptime, which still takes loosely
+    entered dates such as 2024-1-5 and rejects anything else. Results are
+    cached, since the same start and deadline dates are parsed many times
+    per table refresh.
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, DATE_FORMAT)
+
 
 @dataclass
 class Customer:
@@ -15,7 +40,11 @@ class Customer:
     address: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "phone": self.phone,
+            "address": self.address,
+        }
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Customer":
@@ -38,7 +67,16 @@ class Vehicle:
     initial_mileage: float = 0.0
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "plate": self.plate,
+            "vin": self.vin,
+            "vehicle_type": self.vehicle_type,
+            "make": self.make,
+            "model": self.model,
+            "year": self.year,
+            "color": self.color,
+            "initial_mileage": self.initial_mileage,
+        }
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Vehicle":
@@ -69,7 +107,12 @@ class Fee:
     is_default: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "amount": self.amount,
+            "category": self.category,
+            "is_default": self.is_default,
+        }
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Fee":
@@ -94,7 +137,12 @@ class Payment:
     note: str = ""  # Singular: 'note' not 'notes'
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "date": self.date,
+            "amount": self.amount,
+            "method": self.method,
+            "note": self.note,
+        }
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Payment":
@@ -117,7 +165,13 @@ class Notice:
     notes: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "notice_type": self.notice_type,
+            "date_generated": self.date_generated,
+            "date_sent": self.date_sent,
+            "amount_due": self.amount_due,
+            "notes": self.notes,
+        }
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Notice":
@@ -130,6 +184,17 @@ class Notice:
         )
 
 
+# Numeric fee columns on StorageContract. Older records may lack some of them;
+# from_dict only converts the ones present and lets the rest keep their defaults.
+CONTRACT_FEE_FIELDS = frozenset({
+    "daily_storage_fee", "weekly_storage_fee", "monthly_storage_fee",
+    "tow_base_fee", "tow_mileage_rate", "tow_miles_used",
+    "tow_hourly_labor_rate", "tow_labor_hours", "tow_after_hours_fee",
+    "recovery_handling_fee", "lien_processing_fee", "cert_mail_fee",
+    "title_search_fee", "dmv_fee", "sale_fee", "admin_fee",
+})
+
+
 @dataclass
 class StorageContract:
     contract_id: int
@@ -221,23 +286,8 @@ class StorageContract:
             start_date=data.get("start_date", datetime.today().strftime(DATE_FORMAT)),
             contract_type=data.get("contract_type", "storage"),
             rate_mode=data.get("rate_mode", "daily"),
-            daily_storage_fee=float(data.get("daily_storage_fee", 0.0) or 0.0),
-            weekly_storage_fee=float(data.get("weekly_storage_fee", 0.0) or 0.0),
-            monthly_storage_fee=float(data.get("monthly_storage_fee", 0.0) or 0.0),
-            tow_base_fee=float(data.get("tow_base_fee", 0.0) or 0.0),
-            tow_mileage_rate=float(data.get("tow_mileage_rate", 0.0) or 0.0),
-            tow_miles_used=float(data.get("tow_miles_used", 0.0) or 0.0),
-            tow_hourly_labor_rate=float(data.get("tow_hourly_labor_rate", 0.0) or 0.0),
-            tow_labor_hours=float(data.get("tow_labor_hours", 0.0) or 0.0),
-            tow_after_hours_fee=float(data.get("tow_after_hours_fee", 0.0) or 0.0),
-            recovery_handling_fee=float(data.get("recovery_handling_fee", 0.0) or 0.0),
-            lien_processing_fee=float(data.get("lien_processing_fee", 0.0) or 0.0),
-            cert_mail_fee=float(data.get("cert_mail_fee", 0.0) or 0.0),
-            title_search_fee=float(data.get("title_search_fee", 0.0) or 0.0),
-            dmv_fee=float(data.get("dmv_fee", 0.0) or 0.0),
-            sale_fee=float(data.get("sale_fee", 0.0) or 0.0),
             notices_sent=int(data.get("notices_sent", 0)),
-            admin_fee=float(data.get("admin_fee", 0.0) or 0.0),
+            **{name: float(data[name] or 0.0) for name in CONTRACT_FEE_FIELDS.intersection(data)},
             notes=list(data.get("notes", [])),
             attachments=list(data.get("attachments", [])),
             payments=[Payment.from_dict(p) for p in data.get("payments", [])],
@@ -255,6 +305,13 @@ class StorageContract:
 class StorageData:
     contracts: List[StorageContract] = field(default_factory=lambda: [])
     next_id: int = 1
+    # Changes whenever the data set is saved, so views can cache output per
+    # revision instead of tracking every mutation; not persisted
+    revision: int = field(default_factory=lambda: next(_revisions), compare=False, repr=False)
+
+    def mark_changed(self) -> None:
+        """Give the data set a new revision after its contracts were modified."""
+        self.revision = next(_revisions)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -33,7 +33,7 @@ class AppSettingsDialog(QDialog):
         
         # Apply theme colors to dialog background
         colors = get_theme_colors(self.current_theme)
-        self.setStyleSheet(f"QDialog {{ background-color: {colors['bg']}; color: {colors['fg']}; border: 1px solid {colors['border']}; }}")
+        self.setStyleSheet(f"QDialog {{ background-color: {colors.bg}; color: {colors.fg}; border: 1px solid {colors.border}; }}")
         
         layout = QVBoxLayout(self)
         layout.setSpacing(0)
@@ -42,7 +42,7 @@ class AppSettingsDialog(QDialog):
         # Add custom title bar
         title_bar = QWidget()
         title_bar.setFixedHeight(35)
-        title_bar.setStyleSheet(f"background-color: {colors['titlebar_bg']}; color: {colors['titlebar_fg']};")
+        title_bar.setStyleSheet(f"background-color: {colors.titlebar_bg}; color: {colors.titlebar_fg};")
         title_layout = QHBoxLayout(title_bar)
         title_layout.setContentsMargins(10, 0, 5, 0)
         
@@ -55,8 +55,8 @@ class AppSettingsDialog(QDialog):
         close_btn.setFixedSize(35, 30)
         close_btn.setStyleSheet(f"""
             QPushButton {{
-                background-color: {colors['titlebar_bg']};
-                color: {colors['titlebar_fg']};
+                background-color: {colors.titlebar_bg};
+                color: {colors.titlebar_fg};
                 border: none;
                 font-size: 18px;
                 font-weight: bold;
@@ -402,46 +402,48 @@ class AppSettingsDialog(QDialog):
     
     def save_current_settings(self):
         """Save UI controls to settings."""
-        # Appearance
-        self.settings_manager.set('theme', self.theme_combo.currentText())
-        
-        # Display
-        self.settings_manager.set('font_size', self.font_size_combo.currentText())
-        self.settings_manager.set('date_format', self.date_format_combo.currentText())
-        self.settings_manager.set('time_format', self.time_format_combo.currentText())
-        self.settings_manager.set('compact_mode', self.compact_mode_check.isChecked())
-        
-        # Behavior
-        self.settings_manager.set('auto_save_interval', self.auto_save_spin.value())
-        self.settings_manager.set('confirm_before_delete', self.confirm_delete_check.isChecked())
-        self.settings_manager.set('show_tooltips', self.show_tooltips_check.isChecked())
-        self.settings_manager.set('startup_tab', self.startup_tab_combo.currentText())
-        
-        # Alerts
-        self.settings_manager.set('auto_check_alerts', self.auto_check_spin.value())
-        self.settings_manager.set('desktop_notifications', self.desktop_notif_check.isChecked())
-        self.settings_manager.set('alert_sound', self.alert_sound_check.isChecked())
-        
-        # Backup
-        self.settings_manager.set('auto_backup', self.auto_backup_combo.currentText())
-        self.settings_manager.set('backup_location', self.backup_location_edit.text())
-        self.settings_manager.set('keep_records_days', self.keep_records_spin.value())
-        
-        # Defaults
-        self.settings_manager.set('default_vehicle_type', self.default_vehicle_combo.currentText())
-        self.settings_manager.set('default_payment_method', self.default_payment_combo.currentText())
-        self.settings_manager.set('default_admin_fee', self.default_admin_edit.text())
-        
-        # Business Info
-        self.settings_manager.set('business_name', self.business_name_edit.text())
-        self.settings_manager.set('business_address', self.business_address_edit.text())
-        self.settings_manager.set('business_phone', self.business_phone_edit.text())
-        self.settings_manager.set('business_email', self.business_email_edit.text())
-        self.settings_manager.set('business_logo_path', self.business_logo_edit.text())
-        
-        # Reports
-        self.settings_manager.set('include_photos_in_reports', self.include_photos_check.isChecked())
-        self.settings_manager.set('report_footer_text', self.report_footer_edit.text())
+        self.settings_manager.update({
+            # Appearance
+            'theme': self.theme_combo.currentText(),
+
+            # Display
+            'font_size': self.font_size_combo.currentText(),
+            'date_format': self.date_format_combo.currentText(),
+            'time_format': self.time_format_combo.currentText(),
+            'compact_mode': self.compact_mode_check.isChecked(),
+
+            # Behavior
+            'auto_save_interval': self.auto_save_spin.value(),
+            'confirm_before_delete': self.confirm_delete_check.isChecked(),
+            'show_tooltips': self.show_tooltips_check.isChecked(),
+            'startup_tab': self.startup_tab_combo.currentText(),
+
+            # Alerts
+            'auto_check_alerts': self.auto_check_spin.value(),
+            'desktop_notifications': self.desktop_notif_check.isChecked(),
+            'alert_sound': self.alert_sound_check.isChecked(),
+
+            # Backup
+            'auto_backup': self.auto_backup_combo.currentText(),
+            'backup_location': self.backup_location_edit.text(),
+            'keep_records_days': self.keep_records_spin.value(),
+
+            # Defaults
+            'default_vehicle_type': self.default_vehicle_combo.currentText(),
+            'default_payment_method': self.default_payment_combo.currentText(),
+            'default_admin_fee': self.default_admin_edit.text(),
+
+            # Business Info
+            'business_name': self.business_name_edit.text(),
+            'business_address': self.business_address_edit.text(),
+            'business_phone': self.business_phone_edit.text(),
+            'business_email': self.business_email_edit.text(),
+            'business_logo_path': self.business_logo_edit.text(),
+
+            # Reports
+            'include_photos_in_reports': self.include_photos_check.isChecked(),
+            'report_footer_text': self.report_footer_edit.text(),
+        })
         
         # Save to file
         self.settings_manager.save_settings()
@@ -490,8 +492,8 @@ class AppSettingsDialog(QDialog):
             self.parent_window.theme_manager.apply_theme(selected_theme)
             # Update dialog colors
             colors = get_theme_colors(selected_theme)
-            self.setStyleSheet(f"QDialog {{ background-color: {colors['bg']}; color: {colors['fg']}; border: 1px solid {colors['border']}; }}")
-            self.title_bar.setStyleSheet(f"background-color: {colors['titlebar_bg']}; color: {colors['titlebar_fg']};")
+            self.setStyleSheet(f"QDialog {{ background-color: {colors.bg}; color: {colors.fg}; border: 1px solid {colors.border}; }}")
+            self.title_bar.setStyleSheet(f"background-color: {colors.titlebar_bg}; color: {colors.titlebar_fg};")
             self.current_theme = selected_theme
     
     def save_and_close(self):
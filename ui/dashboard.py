@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtGui import QFont, QColor
 from PyQt6.QtCore import Qt
 from datetime import datetime
+from models.lot_models import parse_date
 from utils.theme_config import (get_status_colors, get_stat_card_style, 
                           get_type_card_style, get_dashboard_widget_style)
 
@@ -67,7 +68,7 @@ class StatCard(DashboardCard):
         colors = self.get_colors()
         
         self.setLineWidth(2)
-        self.setStyleSheet(get_stat_card_style(colors, self.accent_color))
+        self.setStyleSheet(get_stat_card_style(self.theme_manager.current_theme, self.accent_color))
         
         layout = QVBoxLayout(self)
         
@@ -84,7 +85,7 @@ class StatCard(DashboardCard):
         
         # Subtitle
         subtitle_label = QLabel(self.subtitle_text)
-        subtitle_label.setStyleSheet(f"color: {colors['fg']}; font-size: 10px; opacity: 0.7;")
+        subtitle_label.setStyleSheet(f"color: {colors.fg}; font-size: 10px; opacity: 0.7;")
         layout.addWidget(subtitle_label)
 
 
@@ -114,7 +115,7 @@ class TypeCard(DashboardCard):
         """Build the card UI."""
         colors = self.get_colors()
         
-        self.setStyleSheet(get_type_card_style(colors, self.accent_color))
+        self.setStyleSheet(get_type_card_style(self.theme_manager.current_theme, self.accent_color))
         
         layout = QVBoxLayout(self)
         
@@ -125,12 +126,12 @@ class TypeCard(DashboardCard):
         
         # Count
         count_label = QLabel(f"Count: {self.count}")
-        count_label.setStyleSheet(f"color: {colors['fg']};")
+        count_label.setStyleSheet(f"color: {colors.fg};")
         layout.addWidget(count_label)
         
         # Revenue
         revenue_label = QLabel(f"Revenue: ${self.revenue:,.2f}")
-        revenue_label.setStyleSheet(f"font-weight: bold; color: {colors['fg']};")
+        revenue_label.setStyleSheet(f"font-weight: bold; color: {colors.fg};")
         layout.addWidget(revenue_label)
 
 
@@ -145,7 +146,7 @@ def create_dashboard_widget(theme_manager, storage_data, main_window):
     Returns:
         QWidget: Complete dashboard widget
     """
-    from logic.lot_logic import balance, past_due_status, lien_eligibility, lien_timeline
+    from logic.lot_logic import contract_balances, past_due_status, lien_eligibility, lien_timeline
     
     colors = theme_manager.get_colors()
     status_colors = get_status_colors(theme_manager.current_theme)
@@ -159,28 +160,48 @@ def create_dashboard_widget(theme_manager, storage_data, main_window):
     # Title
     title = QLabel("📊 Dashboard Overview")
     title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-    title.setStyleSheet(f"padding: 10px; color: {colors['accent']}; background-color: transparent;")
+    title.setStyleSheet(f"padding: 10px; color: {colors.accent}; background-color: transparent;")
     layout.addWidget(title)
     
-    # Calculate statistics
-    total_contracts = len(storage_data.contracts)
-    active_contracts = sum(1 for c in storage_data.contracts if c.status != "Paid")
-    total_paid = sum(sum(p.amount for p in c.payments) for c in storage_data.contracts)
-    outstanding = sum(balance(c, include_breakdown=False) for c in storage_data.contracts if balance(c) > 0)
-    
-    # Past due
-    past_due_contracts = [c for c in storage_data.contracts if past_due_status(c)[0]]
-    past_due_count = len(past_due_contracts)
-    past_due_amount = sum(balance(c) for c in past_due_contracts)
-    
-    # Lien eligible
-    lien_eligible_contracts = [c for c in storage_data.contracts if lien_eligibility(c)[0]]
-    lien_eligible_count = len(lien_eligible_contracts)
-    
-    # Sale eligible
-    sale_eligible_contracts = [c for c in storage_data.contracts 
-                               if lien_timeline(c).get("is_sale_eligible", False)]
-    sale_eligible_count = len(sale_eligible_contracts)
+    # Calculate statistics in a single pass; each contract's balance and lien
+    # timeline are computed once and shared by the cards and the deadline list
+    contracts = storage_data.contracts
+    today = datetime.today()
+    balances = contract_balances(contracts, today)
+    timelines = {}
+    
+    total_contracts = len(contracts)
+    active_contracts = 0
+    total_paid = 0
+    outstanding = 0
+    past_due_count = 0
+    past_due_amount = 0
+    lien_eligible_count = 0
+    sale_eligible_count = 0
+    type_totals = {"storage": [0, 0], "tow": [0, 0], "recovery": [0, 0]}  # type -> [count, balance]
+    
+    for c in contracts:
+        bal = balances[c.contract_id]
+        timeline = timelines[c.contract_id] = lien_timeline(c)
+        
+        if c.status != "Paid":
+            active_contracts += 1
+        total_paid += sum(p.amount for p in c.payments)
+        if bal > 0:
+            outstanding += bal
+        
+        if past_due_status(c)[0]:
+            past_due_count += 1
+            past_due_amount += bal
+        if lien_eligibility(c, today)[0]:
+            lien_eligible_count += 1
+        if timeline.get("is_sale_eligible", False):
+            sale_eligible_count += 1
+        
+        totals = type_totals.get(c.contract_type.lower())
+        if totals is not None:
+            totals[0] += 1
+            totals[1] += bal
     
     # Stat cards row
     cards_layout = QHBoxLayout()
@@ -214,25 +235,19 @@ def create_dashboard_widget(theme_manager, storage_data, main_window):
     breakdown_layout = QHBoxLayout()
     
     # Storage
-    storage_count = sum(1 for c in storage_data.contracts if c.contract_type.lower() == "storage")
-    storage_revenue = sum(balance(c, include_breakdown=False) for c in storage_data.contracts 
-                        if c.contract_type.lower() == "storage")
+    storage_count, storage_revenue = type_totals["storage"]
     storage_card = TypeCard(theme_manager, "Storage Contracts", storage_count,
                            storage_revenue, status_colors['primary'])
     breakdown_layout.addWidget(storage_card)
     
     # Tow
-    tow_count = sum(1 for c in storage_data.contracts if c.contract_type.lower() == "tow")
-    tow_revenue = sum(balance(c, include_breakdown=False) for c in storage_data.contracts 
-                     if c.contract_type.lower() == "tow")
+    tow_count, tow_revenue = type_totals["tow"]
     tow_card = TypeCard(theme_manager, "Tow Contracts", tow_count,
                        tow_revenue, status_colors['success'])
     breakdown_layout.addWidget(tow_card)
     
     # Recovery
-    recovery_count = sum(1 for c in storage_data.contracts if c.contract_type.lower() == "recovery")
-    recovery_revenue = sum(balance(c, include_breakdown=False) for c in storage_data.contracts 
-                          if c.contract_type.lower() == "recovery")
+    recovery_count, recovery_revenue = type_totals["recovery"]
     recovery_card = TypeCard(theme_manager, "Recovery Contracts", recovery_count,
                             recovery_revenue, status_colors['danger'])
     breakdown_layout.addWidget(recovery_card)
@@ -247,15 +262,14 @@ def create_dashboard_widget(theme_manager, storage_data, main_window):
     
     # Find upcoming deadlines
     upcoming = []
-    today = datetime.today()
     
-    for contract in storage_data.contracts:
-        if balance(contract) > 0:
-            timeline = lien_timeline(contract)
+    for contract in contracts:
+        if balances[contract.contract_id] > 0:
+            timeline = timelines[contract.contract_id]
             for key, date_str in timeline.items():
                 if isinstance(date_str, str) and key.endswith('_date'):
                     try:
-                        deadline_date = datetime.strptime(date_str, "%Y-%m-%d")
+                        deadline_date = parse_date(date_str)
                         days_until = (deadline_date - today).days
                         if 0 <= days_until <= 7:
                             upcoming.append({
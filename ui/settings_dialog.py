@@ -10,6 +10,28 @@ from utils.config import ENABLE_INVOLUNTARY_TOWS
 from utils.persistence import save_fee_templates
 from utils.theme_config import get_theme_colors
 
+# Fee template keys for the fee table columns, in display order
+FEE_COLUMN_KEYS_STORAGE_TOW = (
+    "daily_storage_fee", "weekly_storage_fee", "monthly_storage_fee",
+    "tow_base_fee", "tow_mileage_rate", "tow_hourly_labor_rate", "after_hours_fee",
+)
+FEE_COLUMN_KEYS_RECOVERY = (
+    "recovery_handling_fee", "lien_processing_fee", "cert_mail_fee",
+    "title_search_fee", "dmv_fee", "sale_fee",
+)
+FEE_COLUMN_KEYS_COMMON = ("admin_fee", "labor_rate")
+
+
+def fee_column_keys():
+    """Return the fee keys in column order after the vehicle type column.
+    
+    Recovery columns only exist when involuntary towing is enabled.
+    """
+    fee_keys = FEE_COLUMN_KEYS_STORAGE_TOW
+    if ENABLE_INVOLUNTARY_TOWS:
+        fee_keys += FEE_COLUMN_KEYS_RECOVERY
+    return fee_keys + FEE_COLUMN_KEYS_COMMON
+
 
 class SettingsDialog(QDialog):
     """Dialog for managing application settings including fee templates."""
@@ -31,14 +53,14 @@ class SettingsDialog(QDialog):
         
         # Apply theme colors to dialog background
         colors = get_theme_colors(self.current_theme)
-        self.setStyleSheet(f"QDialog {{ background-color: {colors['bg']}; color: {colors['fg']}; border: 1px solid {colors['border']}; }}")
+        self.setStyleSheet(f"QDialog {{ background-color: {colors.bg}; color: {colors.fg}; border: 1px solid {colors.border}; }}")
         
         layout = QVBoxLayout(self)
         
         # Add custom title bar
         title_bar = QWidget()
         title_bar.setFixedHeight(35)
-        title_bar.setStyleSheet(f"background-color: {colors['titlebar_bg']}; color: {colors['titlebar_fg']};")
+        title_bar.setStyleSheet(f"background-color: {colors.titlebar_bg}; color: {colors.titlebar_fg};")
         title_layout = QHBoxLayout(title_bar)
         title_layout.setContentsMargins(10, 0, 5, 0)
         
@@ -55,8 +77,8 @@ class SettingsDialog(QDialog):
         close_btn.setFixedSize(35, 30)
         close_btn.setStyleSheet(f"""
             QPushButton {{
-                background-color: {colors['titlebar_bg']};
-                color: {colors['titlebar_fg']};
+                background-color: {colors.titlebar_bg};
+                color: {colors.titlebar_fg};
                 border: none;
                 font-size: 18px;
                 font-weight: bold;
@@ -72,7 +94,7 @@ class SettingsDialog(QDialog):
         # Add resize grip for bottom-right corner
         from PyQt6.QtWidgets import QSizeGrip
         self.size_grip = QSizeGrip(self)
-        self.size_grip.setStyleSheet(f"background-color: {colors['bg']};")
+        self.size_grip.setStyleSheet(f"background-color: {colors.bg};")
         
         # Position size grip in bottom-right corner
         grip_size = 16
@@ -92,7 +114,7 @@ class SettingsDialog(QDialog):
         info_label = QLabel(info_text)
         info_label.setWordWrap(True)
         colors = get_theme_colors(self.current_theme)
-        info_label.setStyleSheet(f"padding: 10px; background-color: {colors['frame_bg']}; color: {colors['fg']}; border: 1px solid {colors['border']}; border-radius: 5px;")
+        info_label.setStyleSheet(f"padding: 10px; background-color: {colors.frame_bg}; color: {colors.fg}; border: 1px solid {colors.border}; border-radius: 5px;")
         content_layout.addWidget(info_label)
         
         # Fee table
@@ -163,112 +185,49 @@ class SettingsDialog(QDialog):
         """
         # Get colors from theme config (centralized styling)
         colors = get_theme_colors(self.current_theme)
-        bg_color = QBrush(QColor(colors['input_bg']))
-        fg_color = QBrush(QColor(colors['input_fg']))
+        bg_color = QBrush(QColor(colors.input_bg))
+        fg_color = QBrush(QColor(colors.input_fg))
         
-        self.fee_table.setRowCount(len(self.fee_templates))
+        fee_keys = fee_column_keys()
         
-        for i, (vtype, fees) in enumerate(self.fee_templates.items()):
-            col = 0
-            
-            # Vehicle type (non-editable)
-            vtype_item = QTableWidgetItem(vtype)
-            vtype_item.setFlags(vtype_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            vtype_item.setBackground(bg_color)
-            vtype_item.setForeground(fg_color)
-            self.fee_table.setItem(i, col, vtype_item)
-            col += 1
-            
-            # Helper to create and style items
-            def create_item(value):
-                item = QTableWidgetItem(str(value))
-                item.setBackground(bg_color)
-                item.setForeground(fg_color)
-                return item
-            
-            # Storage fees (all contract types)
-            self.fee_table.setItem(i, col, create_item(fees.get("daily_storage_fee", "0")))
-            col += 1
-            self.fee_table.setItem(i, col, create_item(fees.get("weekly_storage_fee", "0")))
-            col += 1
-            self.fee_table.setItem(i, col, create_item(fees.get("monthly_storage_fee", "0")))
-            col += 1
-            
-            # Tow fees (voluntary tow contracts)
-            self.fee_table.setItem(i, col, create_item(fees.get("tow_base_fee", "0")))
-            col += 1
-            self.fee_table.setItem(i, col, create_item(fees.get("tow_mileage_rate", "0")))
-            col += 1
-            self.fee_table.setItem(i, col, create_item(fees.get("tow_hourly_labor_rate", "0")))
-            col += 1
-            self.fee_table.setItem(i, col, create_item(fees.get("after_hours_fee", "0")))
-            col += 1
-            
-            # Recovery fees (only if involuntary towing enabled)
-            if ENABLE_INVOLUNTARY_TOWS:
-                self.fee_table.setItem(i, col, create_item(fees.get("recovery_handling_fee", "0")))
-                col += 1
-                self.fee_table.setItem(i, col, create_item(fees.get("lien_processing_fee", "0")))
-                col += 1
-                self.fee_table.setItem(i, col, create_item(fees.get("cert_mail_fee", "0")))
-                col += 1
-                self.fee_table.setItem(i, col, create_item(fees.get("title_search_fee", "0")))
-                col += 1
-                self.fee_table.setItem(i, col, create_item(fees.get("dmv_fee", "0")))
-                col += 1
-                self.fee_table.setItem(i, col, create_item(fees.get("sale_fee", "0")))
-                col += 1
-            
-            # Common fees
-            self.fee_table.setItem(i, col, create_item(fees.get("admin_fee", "0")))
-            col += 1
-            self.fee_table.setItem(i, col, create_item(fees.get("labor_rate", "0")))
+        def create_item(value):
+            item = QTableWidgetItem(str(value))
+            item.setBackground(bg_color)
+            item.setForeground(fg_color)
+            return item
+        
+        # Fill the whole table with repaints suspended so it lays out once
+        self.fee_table.setUpdatesEnabled(False)
+        try:
+            self.fee_table.setRowCount(len(self.fee_templates))
+            for i, (vtype, fees) in enumerate(self.fee_templates.items()):
+                # Vehicle type (non-editable)
+                vtype_item = create_item(vtype)
+                vtype_item.setFlags(vtype_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                self.fee_table.setItem(i, 0, vtype_item)
+                
+                for col, key in enumerate(fee_keys, start=1):
+                    self.fee_table.setItem(i, col, create_item(fees.get(key, "0")))
+        finally:
+            self.fee_table.setUpdatesEnabled(True)
     
     def save_and_close(self):
         """Save fee templates with validation."""
+        fee_keys = fee_column_keys()
         try:
+            # Parse every cell before touching the templates so a bad value
+            # leaves them unchanged
+            updates = {}
             for i in range(self.fee_table.rowCount()):
                 vtype = self.fee_table.item(i, 0).text()
-                col = 1
-                
                 if vtype in self.fee_templates:
-                    # Storage fees
-                    self.fee_templates[vtype]["daily_storage_fee"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    self.fee_templates[vtype]["weekly_storage_fee"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    self.fee_templates[vtype]["monthly_storage_fee"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    
-                    # Tow fees
-                    self.fee_templates[vtype]["tow_base_fee"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    self.fee_templates[vtype]["tow_mileage_rate"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    self.fee_templates[vtype]["tow_hourly_labor_rate"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    self.fee_templates[vtype]["after_hours_fee"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    
-                    # Recovery fees (only if enabled)
-                    if ENABLE_INVOLUNTARY_TOWS:
-                        self.fee_templates[vtype]["recovery_handling_fee"] = float(self.fee_table.item(i, col).text())
-                        col += 1
-                        self.fee_templates[vtype]["lien_processing_fee"] = float(self.fee_table.item(i, col).text())
-                        col += 1
-                        self.fee_templates[vtype]["cert_mail_fee"] = float(self.fee_table.item(i, col).text())
-                        col += 1
-                        self.fee_templates[vtype]["title_search_fee"] = float(self.fee_table.item(i, col).text())
-                        col += 1
-                        self.fee_templates[vtype]["dmv_fee"] = float(self.fee_table.item(i, col).text())
-                        col += 1
-                        self.fee_templates[vtype]["sale_fee"] = float(self.fee_table.item(i, col).text())
-                        col += 1
-                    
-                    # Common fees
-                    self.fee_templates[vtype]["admin_fee"] = float(self.fee_table.item(i, col).text())
-                    col += 1
-                    self.fee_templates[vtype]["labor_rate"] = float(self.fee_table.item(i, col).text())
+                    updates[vtype] = {
+                        key: float(self.fee_table.item(i, col).text())
+                        for col, key in enumerate(fee_keys, start=1)
+                    }
+            
+            for vtype, fees in updates.items():
+                self.fee_templates[vtype].update(fees)
             
             # Save to file
             save_fee_templates(self.fee_templates)
@@ -16,10 +16,10 @@ class ThemedTableDelegate(QStyledItemDelegate):
     def update_colors(self):
         """Update colors from theme configuration."""
         colors = get_theme_colors(self.theme)
-        self.bg_color = QColor(colors['input_bg'])
-        self.fg_color = QColor(colors['input_fg'])
-        self.selected_bg_color = QColor(colors['button_bg'])
-        self.selected_fg_color = QColor(colors['button_fg'])
+        self.bg_color = QColor(colors.input_bg)
+        self.fg_color = QColor(colors.input_fg)
+        self.selected_bg_color = QColor(colors.button_bg)
+        self.selected_fg_color = QColor(colors.button_fg)
     
     def set_theme(self, theme):
         """Change the theme and update colors."""
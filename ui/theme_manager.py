@@ -51,7 +51,9 @@ class ThemeManager:
         self.current_theme = theme_name
         colors = get_theme_colors(theme_name)
         
-        # Get stylesheet
+        # Get stylesheet. Renders are cached per palette in theme_config and
+        # setStyleSheet must run on the UI thread anyway, so the sheet is
+        # applied synchronously rather than served stale and swapped later
         stylesheet = get_application_stylesheet(colors)
         
         # Apply to entire application (not just main window)
@@ -92,5 +94,5 @@ class ThemeManager:
             self.main_window.status_label.update()
     
     def get_colors(self):
-        """Get current theme colors dictionary."""
+        """Get current theme color palette."""
         return get_theme_colors(self.current_theme)
@@ -6,20 +6,67 @@ Designed to allow future migration from JSON to SQLite without changing other mo
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
 from models.lot_models import StorageContract, StorageData
 
+try:
+    # orjson parses bytes straight into Python objects, several times faster
+    # than the json module. Saves stay on the json module so the file format
+    # does not depend on whether orjson is installed.
+    import orjson
+    
+    def _json_loads(data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals written by json.dumps are not strict JSON
+            return json.loads(data)
+except ImportError:
+    _json_loads = json.loads  # also accepts bytes
+
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 # File paths - data files are now in the data/ folder
 BASE_DIR = Path(__file__).resolve().parent.parent  # Go up to project root
 DATA_PATH = BASE_DIR / "data" / "lot_data.json"
 FEE_TEMPLATE_PATH = BASE_DIR / "data" / "fee_templates.json"
 
 
+def write_json_atomic(path: Path, obj) -> None:
+    """Write JSON to a sibling temp file and swap it into place in one step.
+    
+    Readers never see a half-written file, and a failed dump leaves the
+    previous contents untouched. The temp file is fsynced before the swap so
+    a crash cannot leave the renamed file without its data.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        # Serialize fully in memory, then hand the file a single write
+        payload = _json_dumps(obj)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def load_data(path: Path = DATA_PATH) -> StorageData:
     """Load contract data from JSON file.
     
+    The file is parsed on every call. load_data only runs at startup and on
+    restore, and a restore has to see what is on disk rather than the data
+    set the GUI has already edited, so nothing is cached here.
+    
     Args:
         path: Path to the JSON data file
         
@@ -29,8 +76,7 @@ def load_data(path: Path = DATA_PATH) -> StorageData:
     if not path.exists():
         return StorageData(next_id=1, contracts=[])
     
-    with open(path, "r") as f:
-        data = json.load(f)
+    data = _json_loads(path.read_bytes())
     
     contracts = [StorageContract.from_dict(c) for c in data.get("contracts", [])]
     return StorageData(next_id=data.get("next_id", 1), contracts=contracts)
@@ -43,13 +89,22 @@ def save_data(data: StorageData, path: Path = DATA_PATH) -> None:
         data: StorageData object to save
         path: Path to the JSON data file
     """
-    with open(path, "w") as f:
-        json.dump(data.to_dict(), f, indent=2)
+    write_json_atomic(path, data.to_dict())
+    data.mark_changed()
+
+
+@lru_cache(maxsize=4)
+def _read_fee_templates(path: Path, mtime_ns: int) -> Dict[str, Dict[str, float]]:
+    """Parse the fee templates file; cached until its mtime changes."""
+    return _json_loads(path.read_bytes())
 
 
 def load_fee_templates(path: Path = FEE_TEMPLATE_PATH) -> Dict[str, Dict[str, float]]:
     """Load fee templates from JSON file.
     
+    The file is only re-parsed when its modification time changes; callers
+    get their own copy so edits never leak into the cache.
+    
     Args:
         path: Path to the fee templates JSON file
         
@@ -59,8 +114,8 @@ def load_fee_templates(path: Path = FEE_TEMPLATE_PATH) -> Dict[str, Dict[str, fl
     if not path.exists():
         return {}
     
-    with open(path, "r") as f:
-        return json.load(f)
+    templates = _read_fee_templates(path, path.stat().st_mtime_ns)
+    return {vtype: dict(fees) for vtype, fees in templates.items()}
 
 
 def save_fee_templates(templates: Dict[str, Dict[str, float]], path: Path = FEE_TEMPLATE_PATH) -> None:
@@ -70,8 +125,8 @@ def save_fee_templates(templates: Dict[str, Dict[str, float]], path: Path = FEE_
         templates: Dictionary mapping vehicle type to fee structure
         path: Path to the fee templates JSON file
     """
-    with open(path, "w") as f:
-        json.dump(templates, f, indent=2)
+    write_json_atomic(path, templates)
+    _read_fee_templates.cache_clear()
 
 
 def backup_data(source_path: Path = DATA_PATH, backup_suffix: str = None) -> Path:
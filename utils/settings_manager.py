@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from utils.persistence import write_json_atomic
+
 
 class SettingsManager:
     """Manages application settings with JSON persistence."""
@@ -95,8 +97,9 @@ class SettingsManager:
             # Ensure data directory exists
             self.settings_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+            # Same atomic, fsynced write as the data files, so a failed save
+            # never leaves a half-written settings file behind
+            write_json_atomic(self.settings_path, self.settings)
             return True
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -123,6 +126,14 @@ class SettingsManager:
         """
         self.settings[key] = value
     
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several setting values at once.
+        
+        Args:
+            values: Mapping of setting keys to values
+        """
+        self.settings.update(values)
+    
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
         self.settings = self._get_defaults()
@@ -1,522 +1,677 @@
 """Theme and styling configuration for the application."""
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from string import Template
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeColors:
+    """Immutable color palette for a theme.
+    
+    Colors are read as attributes (``colors.bg``). Indexing by key name
+    (``colors['bg']``) is still supported so palettes can be passed to
+    ``string.Template.substitute``.
+    """
+    bg: str
+    fg: str
+    frame_bg: str
+    frame_fg: str
+    input_bg: str
+    input_fg: str
+    button_bg: str
+    button_fg: str
+    button_hover: str
+    header_bg: str
+    titlebar_bg: str
+    titlebar_fg: str
+    entry_bg: str
+    entry_fg: str
+    select_bg: str
+    select_fg: str
+    tree_odd: str
+    tree_even: str
+    accent: str
+    border: str
+    neutral_border: str
+    scroll_handle: str
+    scroll_hover: str
+    btn_disabled_bg: str
+    btn_disabled_fg: str
+    btn_pressed: str
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+# Neutral grays used by scrollbars, indicators and disabled buttons in every theme
+_NEUTRALS = {
+    "neutral_border": "#555",
+    "scroll_handle": "#555",
+    "scroll_hover": "#777",
+    "btn_disabled_bg": "#555",
+    "btn_disabled_fg": "#888",
+    "btn_pressed": "#0a3a8a",
+}
+
+# Values shared by every palette in a family, merged into each theme
+_DARK_BASE = MappingProxyType({
+    **_NEUTRALS,
+    "button_fg": "#ffffff",
+    "select_fg": "#ffffff",
+})
+_LIGHT_BASE = MappingProxyType({
+    **_NEUTRALS,
+    "input_bg": "#ffffff",
+    "button_fg": "#ffffff",
+    "entry_bg": "#ffffff",
+    "select_fg": "#ffffff",
+})
+
+
+def _build_dark():
+    """Build the Dark palette."""
+    return ThemeColors(
+        **_DARK_BASE,
+        bg="#2b2b2b",
+        fg="#ffffff",
+        frame_bg="#3c3c3c",
+        frame_fg="#ffffff",
+        input_bg="#505050",
+        input_fg="#ffffff",
+        button_bg="#0d47a1",
+        button_hover="#1565c0",
+        header_bg="#1e1e1e",
+        titlebar_bg="#1e1e1e",
+        titlebar_fg="#ffffff",
+        entry_bg="#454545",
+        entry_fg="#ffffff",
+        select_bg="#0078d4",
+        tree_odd="#2b2b2b",
+        tree_even="#333333",
+        accent="#42a5f5",
+        border="#42a5f5",
+    )
+
+
+def _build_light():
+    """Build the Light palette."""
+    return ThemeColors(
+        **_LIGHT_BASE,
+        bg="#f5f5f5",
+        fg="#000000",
+        frame_bg="#ffffff",
+        frame_fg="#000000",
+        input_fg="#000000",
+        button_bg="#1976d2",
+        button_hover="#2196f3",
+        header_bg="#e0e0e0",
+        titlebar_bg="#e0e0e0",
+        titlebar_fg="#000000",
+        entry_fg="#000000",
+        select_bg="#0078d4",
+        tree_odd="#ffffff",
+        tree_even="#f0f0f0",
+        accent="#1976d2",
+        border="#1976d2",
+    )
+
+
+def _build_blue_dark():
+    """Build the Blue Dark palette."""
+    return ThemeColors(
+        **_DARK_BASE,
+        bg="#1a2332",
+        fg="#e0e6ed",
+        frame_bg="#233043",
+        frame_fg="#e0e6ed",
+        input_bg="#2d3e52",
+        input_fg="#e0e6ed",
+        button_bg="#1565c0",
+        button_hover="#1976d2",
+        header_bg="#0f1821",
+        titlebar_bg="#0f1821",
+        titlebar_fg="#e0e6ed",
+        entry_bg="#2d3e52",
+        entry_fg="#e0e6ed",
+        select_bg="#1976d2",
+        tree_odd="#1a2332",
+        tree_even="#233043",
+        accent="#42a5f5",
+        border="#42a5f5",
+    )
+
+
+def _build_green_dark():
+    """Build the Green Dark palette."""
+    return ThemeColors(
+        **_DARK_BASE,
+        bg="#1e2a1e",
+        fg="#e0ede0",
+        frame_bg="#2a3b2a",
+        frame_fg="#e0ede0",
+        input_bg="#364836",
+        input_fg="#e0ede0",
+        button_bg="#2e7d32",
+        button_hover="#388e3c",
+        header_bg="#141a14",
+        titlebar_bg="#141a14",
+        titlebar_fg="#e0ede0",
+        entry_bg="#364836",
+        entry_fg="#e0ede0",
+        select_bg="#43a047",
+        tree_odd="#1e2a1e",
+        tree_even="#2a3b2a",
+        accent="#66bb6a",
+        border="#66bb6a",
+    )
+
+
+def _build_purple_dark():
+    """Build the Purple Dark palette."""
+    return ThemeColors(
+        **_DARK_BASE,
+        bg="#2a1e2e",
+        fg="#ede0f0",
+        frame_bg="#3b2a40",
+        frame_fg="#ede0f0",
+        input_bg="#483650",
+        input_fg="#ede0f0",
+        button_bg="#6a1b9a",
+        button_hover="#7b1fa2",
+        header_bg="#1a141e",
+        titlebar_bg="#1a141e",
+        titlebar_fg="#ede0f0",
+        entry_bg="#483650",
+        entry_fg="#ede0f0",
+        select_bg="#8e24aa",
+        tree_odd="#2a1e2e",
+        tree_even="#3b2a40",
+        accent="#ba68c8",
+        border="#ba68c8",
+    )
+
+
+def _build_warm_light():
+    """Build the Warm Light palette."""
+    return ThemeColors(
+        **_LIGHT_BASE,
+        bg="#faf8f5",
+        fg="#2e2520",
+        frame_bg="#fff9f0",
+        frame_fg="#2e2520",
+        input_fg="#2e2520",
+        button_bg="#d84315",
+        button_hover="#e64a19",
+        header_bg="#f5ebe0",
+        titlebar_bg="#f5ebe0",
+        titlebar_fg="#2e2520",
+        entry_fg="#2e2520",
+        select_bg="#ff6f00",
+        tree_odd="#faf8f5",
+        tree_even="#f5ebe0",
+        accent="#ff6f00",
+        border="#ff6f00",
+    )
+
+
+def _build_cool_light():
+    """Build the Cool Light palette."""
+    return ThemeColors(
+        **_LIGHT_BASE,
+        bg="#f0f4f8",
+        fg="#1a2530",
+        frame_bg="#f8fbff",
+        frame_fg="#1a2530",
+        input_fg="#1a2530",
+        button_bg="#0288d1",
+        button_hover="#039be5",
+        header_bg="#e0e8f0",
+        titlebar_bg="#e0e8f0",
+        titlebar_fg="#1a2530",
+        entry_fg="#1a2530",
+        select_bg="#0288d1",
+        tree_odd="#f0f4f8",
+        tree_even="#e0e8f0",
+        accent="#039be5",
+        border="#039be5",
+    )
+
+
+# Palettes are only built when a theme is first requested
+_BUILDERS = {
+    "Dark": _build_dark,
+    "Light": _build_light,
+    "Blue Dark": _build_blue_dark,
+    "Green Dark": _build_green_dark,
+    "Purple Dark": _build_purple_dark,
+    "Warm Light": _build_warm_light,
+    "Cool Light": _build_cool_light,
+}
+_CACHE = {}
+# Palette constants (_DARK, _BLUE_DARK, ...) resolved lazily by __getattr__
+_PALETTE_ATTRS = {"_" + name.upper().replace(" ", "_"): name for name in _BUILDERS}
+
+
+def __getattr__(name):
+    """Materialize palette constants such as ``_DARK`` on first access (PEP 562)."""
+    theme_name = _PALETTE_ATTRS.get(name)
+    if theme_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    colors = globals()[name] = get_theme_colors(theme_name)
+    return colors
+
 
 def get_theme_colors(theme_name):
     """Return color scheme for the given theme."""
-    if theme_name == "Dark":
-        return {
-            "bg": "#2b2b2b",
-            "fg": "#ffffff",
-            "frame_bg": "#3c3c3c",
-            "frame_fg": "#ffffff",
-            "input_bg": "#505050",
-            "input_fg": "#ffffff",
-            "button_bg": "#0d47a1",
-            "button_fg": "#ffffff",
-            "button_hover": "#1565c0",
-            "header_bg": "#1e1e1e",
-            "titlebar_bg": "#1e1e1e",
-            "titlebar_fg": "#ffffff",
-            "entry_bg": "#454545",
-            "entry_fg": "#ffffff",
-            "select_bg": "#0078d4",
-            "select_fg": "#ffffff",
-            "tree_odd": "#2b2b2b",
-            "tree_even": "#333333",
-            "accent": "#42a5f5",
-            "border": "#42a5f5",
-        }
-    elif theme_name == "Light":
-        return {
-            "bg": "#f5f5f5",
-            "fg": "#000000",
-            "frame_bg": "#ffffff",
-            "frame_fg": "#000000",
-            "input_bg": "#ffffff",
-            "input_fg": "#000000",
-            "button_bg": "#1976d2",
-            "button_fg": "#ffffff",
-            "button_hover": "#2196f3",
-            "header_bg": "#e0e0e0",
-            "titlebar_bg": "#e0e0e0",
-            "titlebar_fg": "#000000",
-            "entry_bg": "#ffffff",
-            "entry_fg": "#000000",
-            "select_bg": "#0078d4",
-            "select_fg": "#ffffff",
-            "tree_odd": "#ffffff",
-            "tree_even": "#f0f0f0",
-            "accent": "#1976d2",
-            "border": "#1976d2",
-        }
-    elif theme_name == "Blue Dark":
-        return {
-            "bg": "#1a2332",
-            "fg": "#e0e6ed",
-            "frame_bg": "#233043",
-            "frame_fg": "#e0e6ed",
-            "input_bg": "#2d3e52",
-            "input_fg": "#e0e6ed",
-            "button_bg": "#1565c0",
-            "button_fg": "#ffffff",
-            "button_hover": "#1976d2",
-            "header_bg": "#0f1821",
-            "titlebar_bg": "#0f1821",
-            "titlebar_fg": "#e0e6ed",
-            "entry_bg": "#2d3e52",
-            "entry_fg": "#e0e6ed",
-            "select_bg": "#1976d2",
-            "select_fg": "#ffffff",
-            "tree_odd": "#1a2332",
-            "tree_even": "#233043",
-            "accent": "#42a5f5",
-            "border": "#42a5f5",
-        }
-    elif theme_name == "Green Dark":
-        return {
-            "bg": "#1e2a1e",
-            "fg": "#e0ede0",
-            "frame_bg": "#2a3b2a",
-            "frame_fg": "#e0ede0",
-            "input_bg": "#364836",
-            "input_fg": "#e0ede0",
-            "button_bg": "#2e7d32",
-            "button_fg": "#ffffff",
-            "button_hover": "#388e3c",
-            "header_bg": "#141a14",
-            "titlebar_bg": "#141a14",
-            "titlebar_fg": "#e0ede0",
-            "entry_bg": "#364836",
-            "entry_fg": "#e0ede0",
-            "select_bg": "#43a047",
-            "select_fg": "#ffffff",
-            "tree_odd": "#1e2a1e",
-            "tree_even": "#2a3b2a",
-            "accent": "#66bb6a",
-            "border": "#66bb6a",
-        }
-    elif theme_name == "Purple Dark":
-        return {
-            "bg": "#2a1e2e",
-            "fg": "#ede0f0",
-            "frame_bg": "#3b2a40",
-            "frame_fg": "#ede0f0",
-            "input_bg": "#483650",
-            "input_fg": "#ede0f0",
-            "button_bg": "#6a1b9a",
-            "button_fg": "#ffffff",
-            "button_hover": "#7b1fa2",
-            "header_bg": "#1a141e",
-            "titlebar_bg": "#1a141e",
-            "titlebar_fg": "#ede0f0",
-            "entry_bg": "#483650",
-            "entry_fg": "#ede0f0",
-            "select_bg": "#8e24aa",
-            "select_fg": "#ffffff",
-            "tree_odd": "#2a1e2e",
-            "tree_even": "#3b2a40",
-            "accent": "#ba68c8",
-            "border": "#ba68c8",
-        }
-    elif theme_name == "Warm Light":
-        return {
-            "bg": "#faf8f5",
-            "fg": "#2e2520",
-            "frame_bg": "#fff9f0",
-            "frame_fg": "#2e2520",
-            "input_bg": "#ffffff",
-            "input_fg": "#2e2520",
-            "button_bg": "#d84315",
-            "button_fg": "#ffffff",
-            "button_hover": "#e64a19",
-            "header_bg": "#f5ebe0",
-            "titlebar_bg": "#f5ebe0",
-            "titlebar_fg": "#2e2520",
-            "entry_bg": "#ffffff",
-            "entry_fg": "#2e2520",
-            "select_bg": "#ff6f00",
-            "select_fg": "#ffffff",
-            "tree_odd": "#faf8f5",
-            "tree_even": "#f5ebe0",
-            "accent": "#ff6f00",
-            "border": "#ff6f00",
-        }
-    elif theme_name == "Cool Light":
-        return {
-            "bg": "#f0f4f8",
-            "fg": "#1a2530",
-            "frame_bg": "#f8fbff",
-            "frame_fg": "#1a2530",
-            "input_bg": "#ffffff",
-            "input_fg": "#1a2530",
-            "button_bg": "#0288d1",
-            "button_fg": "#ffffff",
-            "button_hover": "#039be5",
-            "header_bg": "#e0e8f0",
-            "titlebar_bg": "#e0e8f0",
-            "titlebar_fg": "#1a2530",
-            "entry_bg": "#ffffff",
-            "entry_fg": "#1a2530",
-            "select_bg": "#0288d1",
-            "select_fg": "#ffffff",
-            "tree_odd": "#f0f4f8",
-            "tree_even": "#e0e8f0",
-            "accent": "#039be5",
-            "border": "#039be5",
-        }
-    else:  # Default to Dark
-        return get_theme_colors("Dark")
+    # Unknown names fall back to Dark without getting a cache entry of their
+    # own, so the cache never grows past one palette per known theme
+    name = theme_name if theme_name in _BUILDERS else "Dark"
+    colors = _CACHE.get(name)
+    if colors is None:
+        colors = _CACHE[name] = _BUILDERS[name]()
+    return colors
 
 
-def get_application_stylesheet(colors):
-    """Return the main application stylesheet."""
-    return f"""
-        QMainWindow {{
-            background-color: {colors['bg']};
-            color: {colors['fg']};
+_APP_QSS_TEMPLATE = Template("""
+        QMainWindow {
+            background-color: $bg;
+            color: $fg;
             border: none;
-        }}
-        QWidget {{
-            color: {colors['fg']};
-        }}
-        QDialog {{
-            background-color: {colors['frame_bg']};
-            color: {colors['fg']};
-        }}
-        QScrollArea {{
+        }
+        QWidget {
+            color: $fg;
+        }
+        QDialog {
+            background-color: $frame_bg;
+            color: $fg;
+        }
+        QScrollArea {
             border: none;
             background-color: transparent;
-        }}
-        QScrollArea > QWidget > QWidget {{
-            background-color: {colors['frame_bg']};
-        }}
-        QTabWidget {{
+        }
+        QScrollArea > QWidget > QWidget {
+            background-color: $frame_bg;
+        }
+        QTabWidget {
             border: 0px solid transparent;
-            background: {colors['titlebar_bg']};
-        }}
-        QTabWidget::pane {{
+            background: $titlebar_bg;
+        }
+        QTabWidget::pane {
             border: 0px solid transparent;
             border-top: 0px solid transparent;
-            background: {colors['frame_bg']};
+            background: $frame_bg;
             margin: 0px;
             padding: 0px;
             top: 0px;
-        }}
-        QTabBar {{
+        }
+        QTabBar {
             border: 0px solid transparent;
-            background: {colors['titlebar_bg']};
+            background: $titlebar_bg;
             margin: 0px;
             padding: 0px;
-        }}
-        QTabBar::tab {{
-            background: {colors['frame_bg']};
-            color: {colors['fg']};
+        }
+        QTabBar::tab {
+            background: $frame_bg;
+            color: $fg;
             padding: 10px 20px;
             margin: 0px;
             margin-bottom: 0px;
             border: 0px solid transparent;
-        }}
-        QTabBar::tab:selected {{
-            background: {colors['bg']};
+        }
+        QTabBar::tab:selected {
+            background: $bg;
             font-weight: bold;
             border: 0px solid transparent;
-        }}
-        QTabBar::tab:hover {{
-            background: {colors['header_bg']};
-        }}
-        QLabel {{
-            color: {colors['fg']};
+        }
+        QTabBar::tab:hover {
+            background: $header_bg;
+        }
+        QLabel {
+            color: $fg;
             background: transparent;
-        }}
-        QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QDateEdit {{
-            background-color: {colors['input_bg']};
-            color: {colors['input_fg']};
-            border: 2px solid {colors['accent']};
+        }
+        QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QDateEdit {
+            background-color: $input_bg;
+            color: $input_fg;
+            border: 2px solid $accent;
             border-radius: 4px;
             padding: 5px;
-        }}
-        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus {{
-            border: 2px solid {colors['button_hover']};
-            background-color: {colors['entry_bg']};
-        }}
-        QComboBox {{
-            background-color: {colors['input_bg']};
-            color: {colors['input_fg']};
-            border: 2px solid {colors['accent']};
+        }
+        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus {
+            border: 2px solid $button_hover;
+            background-color: $entry_bg;
+        }
+        QComboBox {
+            background-color: $input_bg;
+            color: $input_fg;
+            border: 2px solid $accent;
             border-radius: 4px;
             padding: 5px;
             padding-right: 25px;
-        }}
-        QComboBox:focus {{
-            border: 2px solid {colors['button_hover']};
-            background-color: {colors['entry_bg']};
-        }}
-        QComboBox::drop-down {{
+        }
+        QComboBox:focus {
+            border: 2px solid $button_hover;
+            background-color: $entry_bg;
+        }
+        QComboBox::drop-down {
             subcontrol-origin: padding;
             subcontrol-position: top right;
             width: 20px;
-            border-left: 1px solid {colors['border']};
-            background: {colors['input_bg']};
+            border-left: 1px solid $border;
+            background: $input_bg;
             border-top-right-radius: 3px;
             border-bottom-right-radius: 3px;
-        }}
-        QComboBox::down-arrow {{
+        }
+        QComboBox::down-arrow {
             image: none;
             border-left: 5px solid transparent;
             border-right: 5px solid transparent;
-            border-top: 5px solid {colors['fg']};
+            border-top: 5px solid $fg;
             margin-right: 3px;
-        }}
-        QComboBox QAbstractItemView {{
-            background-color: {colors['input_bg']};
-            color: {colors['input_fg']};
-            border: 2px solid {colors['accent']};
-            selection-background-color: {colors['select_bg']};
-            selection-color: {colors['select_fg']};
-        }}
-        QPushButton {{
-            background-color: {colors['button_bg']};
-            color: {colors['button_fg']};
+        }
+        QComboBox QAbstractItemView {
+            background-color: $input_bg;
+            color: $input_fg;
+            border: 2px solid $accent;
+            selection-background-color: $select_bg;
+            selection-color: $select_fg;
+        }
+        QPushButton {
+            background-color: $button_bg;
+            color: $button_fg;
             border: none;
             border-radius: 3px;
             padding: 8px 15px;
             font-weight: bold;
-        }}
-        QPushButton:hover {{
-            background-color: {colors['button_hover']};
-        }}
-        QPushButton:pressed {{
-            background-color: #0a3a8a;
-        }}
-        QPushButton:disabled {{
-            background-color: #555;
-            color: #888;
-        }}
-        QTableWidget {{
-            background-color: {colors['frame_bg']};
-            color: {colors['fg']};
-            gridline-color: {colors['border']};
-            border: 1px solid {colors['border']};
-            selection-background-color: {colors['button_bg']};
-            selection-color: {colors['button_fg']};
-        }}
-        QTableWidget::item {{
+        }
+        QPushButton:hover {
+            background-color: $button_hover;
+        }
+        QPushButton:pressed {
+            background-color: $btn_pressed;
+        }
+        QPushButton:disabled {
+            background-color: $btn_disabled_bg;
+            color: $btn_disabled_fg;
+        }
+        QTableWidget {
+            background-color: $frame_bg;
+            color: $fg;
+            gridline-color: $border;
+            border: 1px solid $border;
+            selection-background-color: $button_bg;
+            selection-color: $button_fg;
+        }
+        QTableWidget::item {
             padding: 5px;
-            background-color: {colors['input_bg']};
-            color: {colors['input_fg']};
-        }}
-        QTableWidget::item:selected {{
-            background-color: {colors['button_bg']};
-            color: {colors['button_fg']};
-        }}
-        QTableView {{
-            background-color: {colors['frame_bg']};
-            color: {colors['fg']};
-        }}
-        QHeaderView::section {{
-            background-color: {colors['header_bg']};
-            color: {colors['fg']};
+            background-color: $input_bg;
+            color: $input_fg;
+        }
+        QTableWidget::item:selected {
+            background-color: $button_bg;
+            color: $button_fg;
+        }
+        QTableView {
+            background-color: $frame_bg;
+            color: $fg;
+        }
+        QHeaderView::section {
+            background-color: $header_bg;
+            color: $fg;
             padding: 8px;
             border: none;
             font-weight: bold;
-        }}
-        QScrollBar:vertical {{
-            background: {colors['frame_bg']};
+        }
+        QScrollBar:vertical {
+            background: $frame_bg;
             width: 12px;
             border: none;
-        }}
-        QScrollBar::handle:vertical {{
-            background: #555;
+        }
+        QScrollBar::handle:vertical {
+            background: $scroll_handle;
             border-radius: 6px;
             min-height: 20px;
-        }}
-        QScrollBar::handle:vertical:hover {{
-            background: #777;
-        }}
-        QScrollBar:horizontal {{
-            background: {colors['frame_bg']};
+        }
+        QScrollBar::handle:vertical:hover {
+            background: $scroll_hover;
+        }
+        QScrollBar:horizontal {
+            background: $frame_bg;
             height: 12px;
             border: none;
-        }}
-        QScrollBar::handle:horizontal {{
-            background: #555;
+        }
+        QScrollBar::handle:horizontal {
+            background: $scroll_handle;
             border-radius: 6px;
             min-width: 20px;
-        }}
-        QScrollBar::handle:horizontal:hover {{
-            background: #777;
-        }}
-        QFrame {{
-            background-color: {colors['frame_bg']};
-            color: {colors['fg']};
-        }}
-        QCheckBox {{
-            color: {colors['fg']};
+        }
+        QScrollBar::handle:horizontal:hover {
+            background: $scroll_hover;
+        }
+        QFrame {
+            background-color: $frame_bg;
+            color: $fg;
+        }
+        QCheckBox {
+            color: $fg;
             spacing: 8px;
-        }}
-        QCheckBox::indicator {{
+        }
+        QCheckBox::indicator {
             width: 18px;
             height: 18px;
-            border: 2px solid #555;
+            border: 2px solid $neutral_border;
             border-radius: 3px;
-            background: {colors['input_bg']};
-        }}
-        QCheckBox::indicator:checked {{
-            background: {colors['button_bg']};
-            border-color: {colors['button_bg']};
-        }}
-        QRadioButton {{
-            color: {colors['fg']};
+            background: $input_bg;
+        }
+        QCheckBox::indicator:checked {
+            background: $button_bg;
+            border-color: $button_bg;
+        }
+        QRadioButton {
+            color: $fg;
             spacing: 8px;
-        }}
-        QRadioButton::indicator {{
+        }
+        QRadioButton::indicator {
             width: 18px;
             height: 18px;
-            border: 2px solid #555;
+            border: 2px solid $neutral_border;
             border-radius: 9px;
-            background: {colors['input_bg']};
-        }}
-        QRadioButton::indicator:checked {{
-            background: {colors['button_bg']};
-            border-color: {colors['button_bg']};
-        }}
-        QGroupBox {{
-            color: {colors['fg']};
-            border: 1px solid #555;
+            background: $input_bg;
+        }
+        QRadioButton::indicator:checked {
+            background: $button_bg;
+            border-color: $button_bg;
+        }
+        QGroupBox {
+            color: $fg;
+            border: 1px solid $neutral_border;
             border-radius: 5px;
             margin-top: 10px;
             padding-top: 10px;
             font-weight: bold;
-        }}
-        QGroupBox::title {{
+        }
+        QGroupBox::title {
             subcontrol-origin: margin;
             subcontrol-position: top left;
             padding: 0 5px;
-        }}
-        QMenuBar {{
-            background-color: {colors['titlebar_bg']};
-            color: {colors['titlebar_fg']};
+        }
+        QMenuBar {
+            background-color: $titlebar_bg;
+            color: $titlebar_fg;
             border: none;
-        }}
-        QMenuBar::item:selected {{
-            background-color: {colors['button_bg']};
-        }}
-        QMenu {{
-            background-color: {colors['frame_bg']};
-            color: {colors['fg']};
-            border: 1px solid #555;
-        }}
-        QMenu::item:selected {{
-            background-color: {colors['button_bg']};
-        }}
-        QStatusBar {{
-            background-color: {colors['titlebar_bg']};
-            color: {colors['titlebar_fg']};
+        }
+        QMenuBar::item:selected {
+            background-color: $button_bg;
+        }
+        QMenu {
+            background-color: $frame_bg;
+            color: $fg;
+            border: 1px solid $neutral_border;
+        }
+        QMenu::item:selected {
+            background-color: $button_bg;
+        }
+        QStatusBar {
+            background-color: $titlebar_bg;
+            color: $titlebar_fg;
             border: none;
-        }}
+        }
+    """)
+
+
+def _split_template(template):
+    """Split a string.Template into alternating static text and color keys.
+
+    Even indices hold literal QSS, odd indices hold the palette key that
+    fills the gap between them.
     """
+    source = template.template
+    segments = []
+    literal = ""
+    pos = 0
+    for match in template.pattern.finditer(source):
+        literal += source[pos:match.start()]
+        pos = match.end()
+        key = match.group("named") or match.group("braced")
+        if key is None:  # "$$" escape
+            literal += template.delimiter
+        else:
+            segments += [literal, key]
+            literal = ""
+    segments.append(literal + source[pos:])
+    return segments
+
 
+# Pre-sliced once so a render only swaps in the color slots
+_APP_QSS_SEGMENTS = _split_template(_APP_QSS_TEMPLATE)
+_APP_QSS_COLORS = attrgetter(*_APP_QSS_SEGMENTS[1::2])
 
+
+@lru_cache(maxsize=16)
+def get_application_stylesheet(colors):
+    """Return the main application stylesheet.
+    
+    Cached per palette and interned, so every widget given the sheet
+    shares one string.
+    """
+    segments = _APP_QSS_SEGMENTS[:]
+    segments[1::2] = _APP_QSS_COLORS(colors)
+    return sys.intern("".join(segments))
+
+
+@lru_cache(maxsize=16)
 def get_status_colors(theme_name):
     """Return status-specific colors based on theme.
     
+    Results are cached per theme, so the mapping is read-only.
+    
     Args:
         theme_name: 'Dark' or 'Light'
         
     Returns:
-        dict: Status colors (primary, success, danger, warning, neutral)
+        Mapping: Status colors (primary, success, danger, warning, neutral)
     """
     colors = get_theme_colors(theme_name)
     
-    return {
-        'primary': colors['accent'],
+    return MappingProxyType({
+        'primary': colors.accent,
         'success': '#2e7d32' if theme_name == 'Light' else '#4caf50',
         'danger': '#c62828' if theme_name == 'Light' else '#f44336',
         'warning': '#e65100' if theme_name == 'Light' else '#ff9800',
-        'neutral': colors['border']
-    }
+        'neutral': colors.border
+    })
 
 
-def get_title_bar_widget_style(colors):
-    """Return stylesheet for CustomTitleBar widget.
-    
-    Args:
-        colors: Theme colors dictionary
-        
-    Returns:
-        str: Stylesheet for title bar
-    """
-    return f"""
-        CustomTitleBar {{
-            background-color: {colors['titlebar_bg']};
-            color: {colors['titlebar_fg']};
+_TITLE_BAR_WIDGET_QSS_TEMPLATE = """
+        CustomTitleBar {
+            background-color: %s;
+            color: %s;
             border: none;
             margin: 0px;
             padding: 0px;
-        }}
-        QWidget {{
-            background-color: {colors['titlebar_bg']};
-            color: {colors['titlebar_fg']};
+        }
+        QWidget {
+            background-color: %s;
+            color: %s;
             border: none;
-        }}
+        }
     """
 
 
-def get_title_bar_menu_button_style(colors):
-    """Return stylesheet for title bar menu buttons.
+@lru_cache(maxsize=16)
+def get_title_bar_widget_style(colors):
+    """Return stylesheet for CustomTitleBar widget.
     
     Args:
-        colors: Theme colors dictionary
+        colors: Theme color palette (ThemeColors)
         
     Returns:
-        str: Stylesheet for menu buttons
+        str: Stylesheet for title bar
     """
-    return f"""
-        QPushButton {{
+    return sys.intern(_TITLE_BAR_WIDGET_QSS_TEMPLATE % (colors.titlebar_bg, colors.titlebar_fg, colors.titlebar_bg, colors.titlebar_fg))
+
+
+_TITLE_BAR_MENU_BUTTON_QSS_TEMPLATE = """
+        QPushButton {
             border: none;
             padding: 10px 15px;
-            color: {colors['titlebar_fg']};
+            color: %s;
             background-color: transparent;
             font-size: 12px;
-        }}
-        QPushButton:hover {{
-            background-color: {colors['button_hover']};
-        }}
+        }
+        QPushButton:hover {
+            background-color: %s;
+        }
     """
 
 
-def get_title_bar_search_style(colors):
-    """Return stylesheet for title bar search box.
+@lru_cache(maxsize=16)
+def get_title_bar_menu_button_style(colors):
+    """Return stylesheet for title bar menu buttons.
     
     Args:
-        colors: Theme colors dictionary
+        colors: Theme color palette (ThemeColors)
         
     Returns:
-        str: Stylesheet for search box
+        str: Stylesheet for menu buttons
     """
-    return f"""
-        QLineEdit {{
-            background-color: {colors['entry_bg']};
-            color: {colors['entry_fg']};
-            border: 1px solid {colors['border']};
+    return sys.intern(_TITLE_BAR_MENU_BUTTON_QSS_TEMPLATE % (colors.titlebar_fg, colors.button_hover))
+
+
+_TITLE_BAR_SEARCH_QSS_TEMPLATE = """
+        QLineEdit {
+            background-color: %s;
+            color: %s;
+            border: 1px solid %s;
             padding: 6px 10px;
             border-radius: 4px;
-        }}
-        QLineEdit:focus {{
-            border: 1px solid {colors['accent']};
-        }}
+        }
+        QLineEdit:focus {
+            border: 1px solid %s;
+        }
     """
 
 
-def get_title_bar_control_button_style(colors):
-    """Return stylesheet template for title bar control buttons (min/max/close).
+@lru_cache(maxsize=16)
+def get_title_bar_search_style(colors):
+    """Return stylesheet for title bar search box.
     
     Args:
-        colors: Theme colors dictionary
+        colors: Theme color palette (ThemeColors)
         
     Returns:
-        str: Stylesheet template with %s placeholders for (fg_color, hover_bg)
+        str: Stylesheet for search box
     """
-    return """
+    return sys.intern(_TITLE_BAR_SEARCH_QSS_TEMPLATE % (colors.entry_bg, colors.entry_fg, colors.border, colors.accent))
+
+
+_TITLE_BAR_CONTROL_BUTTON_QSS_TEMPLATE = """
         QPushButton {
             border: none;
             padding: 10px 15px;
@@ -530,75 +685,109 @@ def get_title_bar_control_button_style(colors):
     """
 
 
+def get_title_bar_control_button_style(colors):
+    """Return stylesheet template for title bar control buttons (min/max/close).
+    
+    Args:
+        colors: Theme color palette (unused, kept for API compatibility)
+        
+    Returns:
+        str: Stylesheet template with %s placeholders for (fg_color, hover_bg)
+    """
+    return _TITLE_BAR_CONTROL_BUTTON_QSS_TEMPLATE
+
+
+_CONTENT_WIDGET_QSS_TEMPLATE = "border: none; background-color: %s; margin-top: 0px; padding-top: 0px;"
+
+
+@lru_cache(maxsize=16)
 def get_content_widget_style(colors):
     """Return stylesheet for main content widget.
     
     Args:
-        colors: Theme colors dictionary
+        colors: Theme color palette (ThemeColors)
         
     Returns:
         str: Stylesheet for content widget
     """
-    return f"border: none; background-color: {colors['titlebar_bg']}; margin-top: 0px; padding-top: 0px;"
+    return sys.intern(_CONTENT_WIDGET_QSS_TEMPLATE % colors.titlebar_bg)
 
 
+_DASHBOARD_WIDGET_QSS_TEMPLATE = """
+        QWidget#DashboardWidget {
+            background-color: %s;
+        }
+    """
+
+
+@lru_cache(maxsize=16)
 def get_dashboard_widget_style(colors):
     """Return stylesheet for dashboard widget.
     
     Args:
-        colors: Theme colors dictionary
+        colors: Theme color palette (ThemeColors)
         
     Returns:
         str: Stylesheet for dashboard widget
     """
-    return f"""
-        QWidget#DashboardWidget {{
-            background-color: {colors['bg']};
-        }}
-    """
+    return sys.intern(_DASHBOARD_WIDGET_QSS_TEMPLATE % colors.bg)
+
+
+_STAT_CARD_QSS_TEMPLATE = Template("""
+        QFrame {
+            border: 2px solid $accent_color;
+            border-radius: 8px;
+            background-color: $frame_bg !important;
+            padding: 15px;
+        }
+        QLabel {
+            background-color: transparent;
+        }
+    """)
 
 
-def get_stat_card_style(colors, accent_color):
+@lru_cache(maxsize=128)
+def get_stat_card_style(theme_name, accent_color):
     """Return stylesheet for dashboard stat card.
     
+    Cached per (theme, accent) since a dashboard reuses a handful of accents.
+    
     Args:
-        colors: Theme colors dictionary
+        theme_name: Name of the active theme
         accent_color: Border/accent color for this card
         
     Returns:
         str: Stylesheet for stat card
     """
-    return f"""
-        QFrame {{
-            border: 2px solid {accent_color};
-            border-radius: 8px;
-            background-color: {colors['frame_bg']} !important;
-            padding: 15px;
-        }}
-        QLabel {{
+    colors = get_theme_colors(theme_name)
+    return sys.intern(_STAT_CARD_QSS_TEMPLATE.substitute(accent_color=accent_color, frame_bg=colors.frame_bg))
+
+
+_TYPE_CARD_QSS_TEMPLATE = Template("""
+        QFrame {
+            border: 1px solid $accent_color;
+            border-radius: 5px;
+            background-color: $bg !important;
+            padding: 10px;
+        }
+        QLabel {
             background-color: transparent;
-        }}
-    """
+        }
+    """)
 
 
-def get_type_card_style(colors, accent_color):
+@lru_cache(maxsize=128)
+def get_type_card_style(theme_name, accent_color):
     """Return stylesheet for dashboard type card.
     
+    Cached per (theme, accent) since a dashboard reuses a handful of accents.
+    
     Args:
-        colors: Theme colors dictionary
+        theme_name: Name of the active theme
         accent_color: Border/accent color for this card
         
     Returns:
         str: Stylesheet for type card
     """
-    return f"""
-        QFrame {{
-            border: 1px solid {accent_color};
-            border-radius: 5px;
-            background-color: {colors['bg']} !important;
-            padding: 10px;
-        }}
-        QLabel {{
-            background-color: transparent;
-        }}
-    """
+    colors = get_theme_colors(theme_name)
+    return sys.intern(_TYPE_CARD_QSS_TEMPLATE.substitute(accent_color=accent_color, bg=colors.bg))